@@ -0,0 +1,40 @@
+"""Optional numba support.
+
+``njit`` compiles with numba when it is installed and degrades to the plain
+Python function otherwise, so kernels stay importable in minimal installs.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:  # pragma: no cover - optional dependency
+    from numba import njit as _numba_njit
+    from numba import prange
+
+    NUMBA_AVAILABLE = True
+except Exception:  # pragma: no cover - import fallback if package missing
+    _numba_njit = None  # type: ignore[assignment]
+    prange = range  # type: ignore[misc, assignment]
+    NUMBA_AVAILABLE = False
+
+# Cached kernels record the import path of their module. When the source tree
+# is executed as ``src.quantbobe`` (see the Makefile) a cache written under
+# ``quantbobe`` fails to load, so on-disk caching is only used under the
+# installed package name.
+_CACHE_ENABLED = __name__.split(".")[0] == "quantbobe"
+
+
+def njit(*args: Any, **kwargs: Any) -> Any:
+    """Drop-in for ``numba.njit`` usable with or without arguments."""
+    if _numba_njit is not None:
+        if not _CACHE_ENABLED:
+            kwargs.pop("cache", None)
+        return _numba_njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        return func
+
+    return decorator
@@ -1,6 +1,6 @@
 """Backtest utilities."""
 
-from .engine import BacktestEngine, BacktestResult
+from .engine import BacktestEngine, BacktestResult, TradeLog
 from .reports import ReportBuilder
 
-__all__ = ["BacktestEngine", "BacktestResult", "ReportBuilder"]
+__all__ = ["BacktestEngine", "BacktestResult", "ReportBuilder", "TradeLog"]
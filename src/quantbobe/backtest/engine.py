@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Iterator
 
 import numpy as np
 import pandas as pd
 
 from ..config.schema import CostConfig
 from ..execution.slippage import SlippageModel
+from ._engine_kernel import simulate
 
 
 @dataclass
@@ -20,11 +21,59 @@ class Trade:
     sleeve: str
 
 
+@dataclass
+class TradeLog:
+    """Columnar fill history; entry ``k`` of each array describes one trade."""
+
+    dates: pd.Index
+    symbols: pd.Index
+    date_idx: np.ndarray
+    symbol_idx: np.ndarray
+    qty: np.ndarray
+    price: np.ndarray
+    sleeve: str = "aggregate"
+
+    def __len__(self) -> int:
+        return len(self.qty)
+
+    def __getitem__(self, k: int) -> Trade:
+        return Trade(
+            date=self.dates[self.date_idx[k]],
+            symbol=self.symbols[self.symbol_idx[k]],
+            quantity=float(self.qty[k]),
+            price=float(self.price[k]),
+            notional=float(self.qty[k] * self.price[k]),
+            sleeve=self.sleeve,
+        )
+
+    def __iter__(self) -> Iterator[Trade]:
+        for k in range(len(self)):
+            yield self[k]
+
+    @property
+    def notional(self) -> np.ndarray:
+        return self.qty * self.price
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "date": self.dates[self.date_idx],
+                "symbol": pd.Categorical.from_codes(
+                    self.symbol_idx, categories=self.symbols
+                ),
+                "quantity": self.qty,
+                "price": self.price,
+                "notional": self.notional,
+                "sleeve": self.sleeve,
+            }
+        )
+
+
 @dataclass
 class BacktestResult:
     equity_curve: pd.Series
     positions: pd.DataFrame
-    trades: List[Trade]
+    trades: TradeLog
     pnl: pd.Series
 
 
@@ -37,74 +86,69 @@ class BacktestEngine:
 
     def run(
         self,
-        prices: pd.DataFrame,
+        prices: pd.DataFrame | None,
         target_weights: Dict[str, pd.DataFrame],
         initial_equity: float = 1_000_000.0,
+        *,
+        closes: pd.DataFrame | None = None,
+        opens: pd.DataFrame | None = None,
     ) -> BacktestResult:
-        closes = prices["close"].unstack("symbol")
-        opens = prices["open"].unstack("symbol")
+        """Simulate daily rebalancing towards ``target_weights``.
+
+        ``prices`` is the long (date, symbol) bar frame; callers that already
+        hold wide ``closes``/``opens`` frames can pass them to skip unstacking.
+        """
+        if closes is None or opens is None:
+            if prices is None:
+                raise ValueError("prices is required unless closes and opens are given")
+            if closes is None:
+                closes = prices["close"].unstack("symbol")
+            if opens is None:
+                opens = prices["open"].unstack("symbol")
         dates = closes.index
+        symbols = closes.columns
 
-        positions = pd.DataFrame(0.0, index=dates, columns=closes.columns)
-        cash = pd.Series(initial_equity, index=dates)
-        equity = pd.Series(initial_equity, index=dates)
-        trades: list[Trade] = []
-        current_pos = pd.Series(0.0, index=closes.columns)
-
-        borrow_daily = self.costs.borrow_daily
+        opens_a = np.ascontiguousarray(
+            opens.reindex(columns=symbols).to_numpy(dtype=np.float64)
+        )
+        closes_a = np.ascontiguousarray(closes.to_numpy(dtype=np.float64))
+        n_dates, n_symbols = closes_a.shape
+
+        # Sleeve targets hold between their rebalance dates.
+        targets = np.zeros((n_dates, n_symbols))
+        for df in target_weights.values():
+            aligned = df.reindex(index=dates, columns=symbols).ffill().fillna(0.0)
+            targets += aligned.to_numpy(dtype=np.float64)
+
+        _, equity, positions_a, trade_date, trade_symbol, trade_qty, trade_price = (
+            simulate(
+                opens_a,
+                closes_a,
+                targets,
+                float(self.slippage.spread_bps),
+                float(self.slippage.impact_k),
+                (self.commission_bps + self.timing_slippage_bps) / 10000.0,
+                float(self.costs.borrow_daily),
+                float(initial_equity),
+            )
+        )
 
-        for i, date in enumerate(dates):
-            price_row = opens.iloc[i] if i < len(opens) else closes.iloc[i]
-            day_close = closes.iloc[i]
+        trades = TradeLog(
+            dates=dates,
+            symbols=symbols,
+            date_idx=trade_date,
+            symbol_idx=trade_symbol,
+            qty=trade_qty,
+            price=trade_price,
+        )
 
-            desired_weight = sum(
-                df.loc[date] for df in target_weights.values() if date in df.index
-            )
-            desired_weight = desired_weight.reindex(closes.columns).fillna(0.0)
-
-            equity_prev = equity.iloc[i - 1] if i > 0 else initial_equity
-            target_notional = desired_weight * equity_prev
-            current_notional = current_pos * price_row
-            need_trade = target_notional - current_notional
-
-            for symbol, notional in need_trade.items():
-                if abs(notional) < 1.0:
-                    continue
-                side = np.sign(notional)
-                participation = min(abs(notional) / max(equity_prev, 1.0), 1.0)
-                cost = self.slippage.estimate_cost(participation)
-                trade_price = price_row[symbol] * (1 + cost if side > 0 else 1 - cost)
-                qty = notional / max(trade_price, 1e-6)
-                current_pos[symbol] += qty
-                cash.iloc[i] -= qty * trade_price
-                trade_notional = abs(qty * trade_price)
-                extra_cost = trade_notional * (
-                    (self.commission_bps + self.timing_slippage_bps) / 10000.0
-                )
-                cash.iloc[i] -= extra_cost
-                trades.append(
-                    Trade(
-                        date=date,
-                        symbol=symbol,
-                        quantity=qty,
-                        price=trade_price,
-                        notional=qty * trade_price,
-                        sleeve="aggregate",
-                    )
-                )
-
-            mark_to_market = (current_pos * day_close).sum()
-            borrow_cost = (
-                current_pos[current_pos < 0] * day_close[current_pos < 0]
-            ).sum() * borrow_daily
-            cash.iloc[i] -= borrow_cost
-            equity.iloc[i] = cash.iloc[i] + mark_to_market
-            positions.iloc[i] = current_pos
-
-            if i + 1 < len(dates):
-                cash.iloc[i + 1] = cash.iloc[i]
-
-        pnl = equity.diff().fillna(0.0)
+        # The kernel's output buffers are not shared, so wrap them without the
+        # defensive copy pandas would otherwise make of the (T, N) history.
+        equity_curve = pd.Series(equity, index=dates, copy=False)
+        positions = pd.DataFrame(
+            positions_a, index=dates, columns=symbols, copy=False
+        )
+        pnl = equity_curve.diff().fillna(0.0)
         return BacktestResult(
-            equity_curve=equity, positions=positions, trades=trades, pnl=pnl
+            equity_curve=equity_curve, positions=positions, trades=trades, pnl=pnl
         )
@@ -1,29 +1,51 @@
 from __future__ import annotations
 
+import math
+from typing import TypeAlias
+
 import numpy as np
 import pandas as pd
 
 TRADING_DAYS = 252
 
+Returns: TypeAlias = pd.Series | np.ndarray
+
+
+def _finite(series: Returns) -> np.ndarray:
+    values = np.asarray(series, dtype=np.float64)
+    return values[~np.isnan(values)]
+
 
-def sharpe_ratio(returns: pd.Series, risk_free: float = 0.0) -> float:
-    excess = returns - risk_free / TRADING_DAYS
-    if excess.std(ddof=0) == 0:
+def sharpe_ratio(returns: Returns, risk_free: float = 0.0) -> float:
+    excess = _finite(returns) - risk_free / TRADING_DAYS
+    if excess.size == 0:
+        return float("nan")
+    std = excess.std()
+    if std == 0:
         return 0.0
-    return np.sqrt(TRADING_DAYS) * excess.mean() / excess.std(ddof=0)
+    return math.sqrt(TRADING_DAYS) * float(excess.mean()) / float(std)
 
 
-def sortino_ratio(returns: pd.Series) -> float:
-    downside = returns[returns < 0]
-    if downside.std(ddof=0) == 0:
+def sortino_ratio(returns: Returns) -> float:
+    values = _finite(returns)
+    downside = values[values < 0]
+    if downside.size == 0:
+        return float("nan")
+    std = downside.std()
+    if std == 0:
         return 0.0
-    return np.sqrt(TRADING_DAYS) * returns.mean() / downside.std(ddof=0)
+    return math.sqrt(TRADING_DAYS) * float(values.mean()) / float(std)
 
 
 def max_drawdown(equity: pd.Series) -> float:
-    running_max = equity.cummax()
-    dd = equity / running_max - 1.0
-    return dd.min()
+    values = equity.to_numpy(dtype=np.float64)
+    # fmax skips NaN the same way Series.cummax does.
+    running_max = np.fmax.accumulate(values) if values.size else values
+    with np.errstate(divide="ignore", invalid="ignore"):
+        dd = values / running_max - 1.0
+    if np.isnan(dd).all():
+        return float("nan")
+    return float(np.nanmin(dd))
 
 
 def calmar_ratio(equity: pd.Series) -> float:
@@ -36,5 +58,15 @@ def calmar_ratio(equity: pd.Series) -> float:
     return cagr / dd if dd else 0.0
 
 
-def value_at_risk(returns: pd.Series, alpha: float = 0.95) -> float:
-    return returns.quantile(1 - alpha)
+def value_at_risk(returns: Returns, alpha: float = 0.95) -> float:
+    values = _finite(returns)
+    if values.size == 0:
+        return float("nan")
+    # Linear-interpolated quantile (as Series.quantile) from an O(n) partition
+    # around the two neighbouring order statistics instead of a full sort.
+    position = (1 - alpha) * (values.size - 1)
+    lower = int(math.floor(position))
+    upper = min(lower + 1, values.size - 1)
+    ordered = np.partition(values, (lower, upper))
+    low_value = ordered[lower]
+    return float(low_value + (ordered[upper] - low_value) * (position - lower))
@@ -5,7 +5,6 @@ from typing import Dict
 
 import numpy as np
 import pandas as pd
-import plotly.graph_objects as go
 
 from .metrics import sharpe_ratio, sortino_ratio, value_at_risk
 
@@ -17,10 +16,20 @@ class ReportBuilder:
         self.equity = equity
         self.trades = trades
         self.positions = positions
+        self._summary: Dict[str, float] | None = None
 
     def build_summary(self) -> Dict[str, float]:
+        """Return headline metrics, computed once per builder."""
+        if self._summary is None:
+            self._summary = self._compute_summary()
+        return dict(self._summary)
+
+    def _compute_summary(self) -> Dict[str, float]:
         equity = self.equity
-        returns = equity.pct_change(fill_method=None).dropna()
+        equity_values = equity.to_numpy(dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            returns = equity_values[1:] / equity_values[:-1] - 1.0
+        returns = returns[~np.isnan(returns)]
         ann_factor = 252.0
 
         if equity.empty or len(equity) < 2:
@@ -44,26 +53,39 @@ class ReportBuilder:
             max_dd = float(drawdown.min()) if not drawdown.empty else float("nan")
             calmar = cagr / abs(max_dd) if max_dd < 0 else float("nan")
 
-        sharpe = sharpe_ratio(returns) if not returns.empty else float("nan")
-        sortino = sortino_ratio(returns) if not returns.empty else float("nan")
-        var_95 = value_at_risk(returns, 0.95) if not returns.empty else float("nan")
-        var_99 = value_at_risk(returns, 0.99) if not returns.empty else float("nan")
+        has_returns = returns.size > 0
+        sharpe = sharpe_ratio(returns) if has_returns else float("nan")
+        sortino = sortino_ratio(returns) if has_returns else float("nan")
+        var_95 = value_at_risk(returns, 0.95) if has_returns else float("nan")
+        var_99 = value_at_risk(returns, 0.99) if has_returns else float("nan")
 
         if self.trades.empty or equity.empty:
             turnover = 0.0
         else:
-            daily_notional = (
-                self.trades.assign(notional=self.trades["notional"].abs())
-                .groupby("date")["notional"]
-                .sum()
-            )
-            equity_for_turnover = equity.reindex(daily_notional.index).ffill()
-            turnover_series = daily_notional / equity_for_turnover.replace(0, np.nan)
-            turnover = (
-                float(turnover_series.mean(skipna=True))
-                if not turnover_series.empty
-                else 0.0
+            date_idx = equity.index.get_indexer(self.trades["date"])
+            on_index = date_idx >= 0
+            date_idx = date_idx[on_index]
+            notional = np.abs(self.trades["notional"].to_numpy(dtype=np.float64))
+            daily_notional = np.bincount(
+                date_idx,
+                weights=np.nan_to_num(notional[on_index]),
+                minlength=len(equity),
             )
+            traded = np.bincount(date_idx, minlength=len(equity)) > 0
+            equity_traded = equity.to_numpy(dtype=np.float64)[traded]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                turnover_series = np.where(
+                    equity_traded != 0,
+                    daily_notional[traded] / equity_traded,
+                    np.nan,
+                )
+            turnover_series = turnover_series[~np.isnan(turnover_series)]
+            if not traded.any():
+                turnover = 0.0
+            elif turnover_series.size == 0:
+                turnover = float("nan")
+            else:
+                turnover = float(turnover_series.mean())
 
         return {
             "CAGR": cagr,
@@ -77,6 +99,9 @@ class ReportBuilder:
         }
 
     def to_html(self, path: str | Path) -> None:
+        # Imported here so CLI paths that never render HTML skip loading plotly.
+        import plotly.graph_objects as go
+
         path = Path(path)
         path.parent.mkdir(parents=True, exist_ok=True)
         fig = go.Figure()
@@ -89,15 +114,13 @@ class ReportBuilder:
             cells=dict(values=[list(summary.values())]),
         )
         fig2 = go.Figure(data=[metrics_table])
-        equity_html = fig.to_html(full_html=False)
-        summary_html = fig2.to_html(full_html=False)
-        html = (
-            "<h1>Equity Curve</h1>"
-            f"{equity_html}"
-            "<h2>Summary</h2>"
-            f"{summary_html}"
-        )
-        path.write_text(html, encoding="utf-8")
+        # Write figures straight to the file; plotly.js is embedded once with
+        # the first figure so the report still opens offline.
+        with path.open("w", encoding="utf-8") as fh:
+            fh.write("<h1>Equity Curve</h1>")
+            fig.write_html(fh, full_html=False, include_plotlyjs=True)
+            fh.write("<h2>Summary</h2>")
+            fig2.write_html(fh, full_html=False, include_plotlyjs=False)
 
     def trades_to_csv(self, path: str | Path) -> None:
         path = Path(path)
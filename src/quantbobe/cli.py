@@ -3,38 +3,59 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import multiprocessing
+import os
 import shutil
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timezone, tzinfo
 from pathlib import Path
-from typing import Dict, Mapping
+from typing import Any, Dict, Mapping
 from zoneinfo import ZoneInfo
 
 import pandas as pd
 from loguru import logger
 
-from .backtest import BacktestEngine, ReportBuilder
+from .backtest import BacktestEngine, BacktestResult, ReportBuilder
 from .live.run_live import run_live
 from .strategy import (
+    StrategyContext,
     aggregate_target_weights,
     build_context,
     compute_sleeve_weights,
 )
 
+# zstd at a low level compresses cached price history well below the snappy
+# default while staying cheap to decode on every backtest read.
+_PARQUET_OPTIONS: Dict[str, Any] = {
+    "engine": "pyarrow",
+    "compression": "zstd",
+    "compression_level": 3,
+}
+
+# Batch workers run one backtest each; keep BLAS/OpenMP pools single-threaded
+# so N workers do not oversubscribe the machine.
+_WORKER_THREAD_VARS = (
+    "OMP_NUM_THREADS",
+    "OPENBLAS_NUM_THREADS",
+    "MKL_NUM_THREADS",
+    "NUMEXPR_NUM_THREADS",
+)
+
 
 def ingest_command(config_path: str) -> None:
     ctx = build_context(config_path)
     output_dir = Path(ctx.settings.data.path) / "cache"
     output_dir.mkdir(parents=True, exist_ok=True)
     daily_path = output_dir / "daily.parquet"
-    ctx.daily.to_parquet(daily_path)
+    ctx.daily.to_parquet(daily_path, **_PARQUET_OPTIONS)
     logger.info("Saved daily history to {}", daily_path)
     if not ctx.fundamentals.empty:
         fund_path = output_dir / "fundamentals.parquet"
-        ctx.fundamentals.to_parquet(fund_path)
+        ctx.fundamentals.to_parquet(fund_path, **_PARQUET_OPTIONS)
         logger.info("Saved fundamentals to {}", fund_path)
 
 
-def _prepare_run_dir(ctx, config_path: str) -> Path:
+def _prepare_run_dir(ctx, config_path: str, label: str | None = None) -> Path:
     runs_root = Path(ctx.settings.reports.runs_dir)
     tz: tzinfo
 
@@ -43,7 +64,10 @@ def _prepare_run_dir(ctx, config_path: str) -> Path:
     except Exception:
         tz = timezone.utc
     now = datetime.now(tz)
-    run_dir = runs_root / now.strftime("%Y%m%dT%H%M%S")
+    run_name = now.strftime("%Y%m%dT%H%M%S")
+    if label:
+        run_name = f"{run_name}-{label}"
+    run_dir = runs_root / run_name
     run_dir.mkdir(parents=True, exist_ok=True)
     config_src = Path(config_path)
     if config_src.exists():
@@ -51,6 +75,49 @@ def _prepare_run_dir(ctx, config_path: str) -> Path:
     return run_dir
 
 
+def _write_csv(frame: pd.DataFrame, path: Path, index: bool = True) -> None:
+    """Write ``frame`` with pyarrow's C++ CSV writer, falling back to pandas.
+
+    The bytes match ``frame.to_csv(path, index=index)``: integer and string
+    columns go to Arrow as-is, every other column is first rendered with
+    pandas' own ``astype(str)`` (floats keep ``1e-05`` and ``100.0``,
+    timestamps drop to ``YYYY-MM-DD`` only when all are midnight, booleans
+    are ``True``/``False``) and missing values are left empty.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:  # pragma: no cover - optional dependency
+        frame.to_csv(path, index=index)
+        return
+    data = frame.reset_index() if index else frame
+    unnamed_index = index and None in frame.index.names
+    if unnamed_index or data.columns.nlevels > 1 or not data.columns.is_unique:
+        # Header layouts Arrow cannot reproduce.
+        frame.to_csv(path, index=index)
+        return
+    columns = {}
+    for name, column in data.items():
+        if column.dtype.kind in "iu" or isinstance(column.dtype, pd.StringDtype):
+            columns[str(name)] = pa.array(column)
+        else:
+            text = column.astype(str).to_numpy(dtype=object)
+            columns[str(name)] = pa.array(
+                text, type=pa.string(), mask=column.isna().to_numpy()
+            )
+    try:
+        pacsv.write_csv(
+            pa.table(columns),
+            path,
+            write_options=pacsv.WriteOptions(
+                quoting_style="none", quoting_header="none"
+            ),
+        )
+    except pa.ArrowInvalid:
+        # A value needs quoting (embedded comma or quote); let pandas handle it.
+        frame.to_csv(path, index=index)
+
+
 def _write_run_artifacts(
     run_dir: Path,
     result,
@@ -69,10 +136,10 @@ def _write_run_artifacts(
     metrics_json = json.dumps(metrics, indent=2, sort_keys=True)
     metrics_path.write_text(metrics_json, encoding="utf-8")
 
-    trades_df.to_csv(run_dir / "trades.csv", index=False)
-    result.positions.to_csv(run_dir / "positions.csv")
-    result.equity_curve.to_csv(run_dir / "equity.csv", header=["equity"])
-    result.pnl.to_csv(run_dir / "pnl.csv", header=["pnl"])
+    _write_csv(trades_df, run_dir / "trades.csv", index=False)
+    _write_csv(result.positions, run_dir / "positions.csv")
+    _write_csv(result.equity_curve.to_frame("equity"), run_dir / "equity.csv")
+    _write_csv(result.pnl.to_frame("pnl"), run_dir / "pnl.csv")
 
     summary_lines = ["# Backtest Summary"]
     for key, value in metrics.items():
@@ -83,23 +150,26 @@ def _write_run_artifacts(
     logger.info("Saved reproducibility bundle to {}", run_dir)
 
 
-
-def backtest_command(config_path: str) -> None:
-    ctx = build_context(config_path)
+def _run_backtest(
+    ctx: StrategyContext,
+) -> tuple[BacktestResult, pd.DataFrame, ReportBuilder]:
     sleeve_weights = compute_sleeve_weights(ctx)
-    closes = ctx.daily["close"].unstack("symbol")
-    dates = closes.index
+    closes = ctx.wide("close")
     aggregate = aggregate_target_weights(ctx, sleeve_weights)
-    aggregate = aggregate.reindex(dates).ffill().fillna(0.0)
+    aggregate = aggregate.reindex(closes.index).ffill().fillna(0.0)
     daily_targets: Dict[str, pd.DataFrame] = {"portfolio": aggregate}
     engine = BacktestEngine(ctx.settings.costs)
-    result = engine.run(ctx.daily, daily_targets)
-    trades_df = pd.DataFrame([t.__dict__ for t in result.trades])
-    if trades_df.empty:
-        trades_df = pd.DataFrame(
-            columns=["date", "symbol", "quantity", "price", "notional", "sleeve"]
-        )
+    result = engine.run(
+        ctx.daily, daily_targets, closes=closes, opens=ctx.wide("open")
+    )
+    trades_df = result.trades.to_frame()
     report = ReportBuilder(result.equity_curve, trades_df, result.positions)
+    return result, trades_df, report
+
+
+def backtest_command(config_path: str) -> None:
+    ctx = build_context(config_path)
+    result, trades_df, report = _run_backtest(ctx)
     report.to_html(ctx.settings.reports.html)
     report.trades_to_csv(ctx.settings.reports.trades_csv)
     summary = report.build_summary()
@@ -113,6 +183,59 @@ def backtest_command(config_path: str) -> None:
     logger.info("Saved equity curve to {}", equity_out)
 
 
+def _backtest_worker(config_path: str, label: str) -> tuple[Path, Dict[str, float]]:
+    # Each worker loads its own context so price history is never pickled.
+    ctx = build_context(config_path)
+    result, trades_df, report = _run_backtest(ctx)
+    summary = report.build_summary()
+    run_dir = _prepare_run_dir(ctx, config_path, label=label)
+    _write_run_artifacts(run_dir, result, trades_df, summary)
+    return run_dir, summary
+
+
+def backtest_batch_command(configs: list[str], workers: int | None = None) -> None:
+    """Run one backtest per config in parallel worker processes."""
+    if not configs:
+        raise ValueError("backtest-batch requires at least one config")
+    max_workers = max(1, min(workers or os.cpu_count() or 1, len(configs)))
+    # Spawned workers inherit the environment, so this caps their thread pools
+    # without touching libraries already initialised in this process.
+    for var in _WORKER_THREAD_VARS:
+        os.environ.setdefault(var, "1")
+
+    # Keyed by position so the same config listed twice keeps both runs.
+    summaries: dict[int, Dict[str, float]] = {}
+    failed: list[str] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        futures = {
+            pool.submit(_backtest_worker, path, f"{i:02d}-{Path(path).stem}"): i
+            for i, path in enumerate(configs)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            try:
+                run_dir, summary = future.result()
+            except Exception as exc:
+                logger.error("Backtest failed for {}: {}", configs[i], exc)
+                failed.append(configs[i])
+                continue
+            logger.info("Finished {} -> {}", configs[i], run_dir)
+            summaries[i] = summary
+
+    for i, path in enumerate(configs):
+        if i not in summaries:
+            continue
+        metrics = " | ".join(
+            f"{key}: {value:.4f}" for key, value in summaries[i].items()
+        )
+        logger.info("{} | {}", path, metrics)
+    if failed:
+        raise RuntimeError(f"{len(failed)} of {len(configs)} backtests failed")
+
+
 def report_command(config_path: str) -> None:
     logger.info("Regenerating backtest and report")
     backtest_command(config_path)
@@ -128,6 +251,12 @@ def parse_args() -> argparse.Namespace:
     backtest = subparsers.add_parser("backtest", help="Run backtest")
     backtest.add_argument("--config", required=True)
 
+    batch = subparsers.add_parser(
+        "backtest-batch", help="Run several backtests in parallel"
+    )
+    batch.add_argument("--configs", nargs="+", required=True)
+    batch.add_argument("--workers", type=int, default=None)
+
     report = subparsers.add_parser("report", help="Run report generation")
     report.add_argument("--config", required=True)
 
@@ -143,6 +272,8 @@ def main() -> None:
         ingest_command(args.config)
     elif args.command == "backtest":
         backtest_command(args.config)
+    elif args.command == "backtest-batch":
+        backtest_batch_command(args.configs, args.workers)
     elif args.command == "report":
         report_command(args.config)
     elif args.command == "live":
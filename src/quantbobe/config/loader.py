@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import pathlib
 from typing import Any
 
@@ -9,8 +10,18 @@ from .schema import Settings
 
 
 def load_settings(path: str | pathlib.Path) -> Settings:
-    """Load configuration from YAML into a Settings instance."""
+    """Load configuration from YAML into a Settings instance.
+
+    Results are cached per resolved path and modification time, so repeated
+    loads of an unchanged file skip YAML parsing and validation. The returned
+    instance is shared between callers and must be treated as read-only.
+    """
     config_path = pathlib.Path(path).expanduser().resolve()
+    return _load_settings_cached(config_path, config_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_settings_cached(config_path: pathlib.Path, mtime_ns: int) -> Settings:
     with config_path.open("r", encoding="utf-8") as fh:
         data: dict[str, Any] = yaml.safe_load(fh) or {}
     return Settings.model_validate(data)
@@ -19,6 +19,8 @@ class DataConfig(BaseModel):
     end: Optional[date] = None
     timeframe: str = "1Day"
     symbols: Optional[list[str]] = None
+    bar_cache: bool = True
+    bar_cache_recent_ttl_minutes: float = 15.0
 
 
 class CostConfig(BaseModel):
@@ -100,6 +102,7 @@ class LiveConfig(BaseModel):
     news_general_headlines: int = 3
     news_refresh_minutes: int = 60
     news_lookback_hours: int = 24
+    news_cache: bool = True
 
 
 class AlpacaConfig(BaseModel):
@@ -128,13 +131,10 @@ class SleevesConfig(BaseModel):
     )
 
     def enabled_sleeves(self) -> Iterable[tuple[str, SleeveConfig]]:
-        for name, cfg in self.model_dump().items():
-            if isinstance(cfg, dict):
-                enabled = cfg.get("enabled", False)
-            else:
-                enabled = getattr(cfg, "enabled", False)
-            if enabled:
-                yield name, getattr(self, name)
+        for name in type(self).model_fields:
+            cfg = getattr(self, name)
+            if getattr(cfg, "enabled", False):
+                yield name, cfg
 
 
 class Settings(BaseModel):
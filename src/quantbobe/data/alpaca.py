@@ -1,17 +1,29 @@
 from __future__ import annotations
 
+import json
 import os
 import warnings
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Iterable, cast
+from typing import Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import requests  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 
 from ..config.schema import Settings
-from .base import IDataProvider, SymbolMeta
+from .base import (
+    IDataProvider,
+    SymbolMeta,
+    arrow_to_pandas,
+    as_symbol_sequence,
+    read_universe,
+    sort_by_index,
+)
 
 warnings.filterwarnings(
     "ignore",
@@ -20,21 +32,32 @@ warnings.filterwarnings(
     module="websockets.legacy",
 )
 
-if TYPE_CHECKING:  # pragma: no cover - typing aid only
-    from alpaca.data.timeframe import TimeFrame
-
-_ALPACA_PY_AVAILABLE = False
-_ALPACA_PY_IMPORT_ERROR: str | None = None
-
-
-_TIMEFRAME_MAP = {
-    "1Min": lambda TF, TFU: TF.Minute,
-    "5Min": lambda TF, TFU: TF(5, TFU.Minute),
-    "15Min": lambda TF, TFU: TF(15, TFU.Minute),
-    "30Min": lambda TF, TFU: TF(30, TFU.Minute),
-    "1Hour": lambda TF, TFU: TF.Hour,
-    "1Day": lambda TF, TFU: TF.Day,
+# Bars older than this are treated as final and cached without expiry; the
+# recent tail is refetched once its cache entry exceeds the configured TTL.
+_HISTORICAL_AFTER = timedelta(days=7)
+_BAR_ADJUSTMENT = "raw"
+_BAR_COLUMNS = ("open", "high", "low", "close", "adj_close", "volume")
+# Parquet schema metadata recording the request windows a symbol file covers,
+# as a JSON list of disjoint [start, end] ISO pairs, and when its latest
+# window was fetched.
+_COVERED_RANGES = b"quantbobe.covered_ranges"
+_FETCHED_AT = b"quantbobe.fetched_at"
+
+_TIMEFRAMES = frozenset({"1Min", "5Min", "15Min", "30Min", "1Hour", "1Day"})
+_BARS_PAGE_LIMIT = 10_000
+_BARS_TIMEOUT_SECONDS = 30.0
+# Alpaca REST bar fields mapped to the column names used downstream.
+_BAR_FIELDS = {
+    "t": "timestamp",
+    "o": "open",
+    "h": "high",
+    "l": "low",
+    "c": "close",
+    "v": "volume",
+    "n": "trade_count",
+    "vw": "vwap",
 }
+_FLOAT_BAR_COLUMNS = ("open", "high", "low", "close", "volume", "vwap")
 
 
 def _ensure_utc(dt: datetime) -> datetime:
@@ -47,10 +70,14 @@ class AlpacaProvider(IDataProvider):
     """Market data provider backed by Alpaca Market Data API."""
 
     def __init__(self, settings: Settings) -> None:
-        load_dotenv()
         self.settings = settings
         self.data_config = settings.data
         self.alpaca_config = settings.alpaca
+        if not (
+            os.getenv(self.alpaca_config.key_env)
+            and os.getenv(self.alpaca_config.secret_env)
+        ):
+            load_dotenv()
         key = os.getenv(self.alpaca_config.key_env)
         secret = os.getenv(self.alpaca_config.secret_env)
         if not key or not secret:
@@ -60,132 +87,175 @@ class AlpacaProvider(IDataProvider):
                 f"{self.alpaca_config.secret_env} are set."
             )
             raise EnvironmentError(message)
-        self._alpaca_py_modules: dict[str, Any] | None = None
-        self.client = self._try_init_alpaca_py(key, secret)
-        if self.client is None:
-            raise ImportError(
-                "Alpaca provider requires the alpaca-py package. "
-                f"alpaca-py import error: {_ALPACA_PY_IMPORT_ERROR}"
-            )
+        self._headers = {"APCA-API-KEY-ID": key, "APCA-API-SECRET-KEY": secret}
         self._meta = self._load_symbol_meta()
 
-    def _try_init_alpaca_py(self, key: str, secret: str):
-        global _ALPACA_PY_AVAILABLE, _ALPACA_PY_IMPORT_ERROR
-        _ensure_urllib3_six_moves()
-        try:  # pragma: no cover - optional dependency
-            from alpaca.data.historical import StockHistoricalDataClient
-            from alpaca.data.requests import StockBarsRequest
-            from alpaca.data.timeframe import TimeFrame, TimeFrameUnit
-        except Exception as exc:  # pragma: no cover - align with optional install
-            _ALPACA_PY_IMPORT_ERROR = str(exc)
-            return None
-        try:
-            client = StockHistoricalDataClient(
-                api_key=key,
-                secret_key=secret,
-                url_override=self.alpaca_config.data_base_url,
-            )
-            self._alpaca_py_modules = {
-                "StockBarsRequest": StockBarsRequest,
-                "TimeFrame": TimeFrame,
-                "TimeFrameUnit": TimeFrameUnit,
-            }
-            _ALPACA_PY_AVAILABLE = True
-            _ALPACA_PY_IMPORT_ERROR = None
-            return client
-        except Exception as exc:  # pragma: no cover - defensive guard
-            _ALPACA_PY_IMPORT_ERROR = str(exc)
-            return None
+    @cached_property
+    def _session(self) -> requests.Session:
+        """HTTP session for the market data API, reusing its connection pool."""
+        session = requests.Session()
+        session.headers.update(self._headers)
+        return session
 
     def _load_symbol_meta(self) -> list[SymbolMeta]:
-        symbols: list[str]
         path = Path(self.data_config.path)
         universe_path = path / self.data_config.equities_universe
         if self.data_config.symbols:
-            symbols = list(self.data_config.symbols)
-            sectors = {}
-        elif universe_path.exists():
-            df = pd.read_csv(universe_path)
-            if "symbol" not in df.columns:
-                raise ValueError(
-                    f"Universe file {universe_path} missing 'symbol' column"
-                )
-            symbols = df["symbol"].astype(str).tolist()
-            sectors = df.set_index("symbol").to_dict().get("sector", {})
-        else:
-            raise FileNotFoundError(
-                "Equities universe file not found and no explicit symbols provided "
-                "for Alpaca provider"
-            )
-        meta = []
-        for symbol in symbols:
-            meta.append(SymbolMeta(symbol=symbol, sector=sectors.get(symbol)))
-        return meta
+            return [SymbolMeta(symbol=symbol) for symbol in self.data_config.symbols]
+        if universe_path.exists():
+            return read_universe(universe_path)
+        raise FileNotFoundError(
+            "Equities universe file not found and no explicit symbols provided "
+            "for Alpaca provider"
+        )
 
     @cached_property
     def symbols(self) -> list[str]:
         return [m.symbol for m in self._meta]
 
-    def _resolve_timeframe(self) -> TimeFrame:
+    def _resolve_timeframe(self) -> str:
         tf = self.data_config.timeframe or "1Day"
-        modules = self._alpaca_py_modules
-        if not modules:
-            raise ImportError("alpaca-py is required to resolve Alpaca timeframes")
-        if tf not in _TIMEFRAME_MAP:
+        if tf not in _TIMEFRAMES:
             raise ValueError(f"Unsupported Alpaca timeframe '{tf}'")
-        TimeFrame = cast(Any, modules["TimeFrame"])
-        TimeFrameUnit = cast(Any, modules["TimeFrameUnit"])
-        return _TIMEFRAME_MAP[tf](TimeFrame, TimeFrameUnit)
+        return tf
 
     def get_daily_bars(
         self, symbols: Iterable[str], start: datetime, end: datetime
     ) -> pd.DataFrame:
-        symbols = list(symbols) or self.symbols
+        symbols = as_symbol_sequence(symbols) or self.symbols
         if not symbols:
             return pd.DataFrame()
         start_utc = _ensure_utc(start)
         end_utc = _ensure_utc(end)
         timeframe = self._resolve_timeframe()
-        modules: dict[str, Any] = self._alpaca_py_modules or {}
-        StockBarsRequest = cast(Any, modules.get("StockBarsRequest"))
-        if StockBarsRequest is None:
-            raise ImportError("alpaca-py components unavailable to request bars")
-        request = StockBarsRequest(
-            symbol_or_symbols=symbols,
-            timeframe=timeframe,
-            start=start_utc,
-            end=end_utc,
-            feed=self.alpaca_config.data_feed,
-            adjustment="raw",
-            limit=None,
-        )
-        response = self.client.get_stock_bars(request)
-        df = response.df
+        if self.data_config.bar_cache:
+            df = self._cached_bars(timeframe, symbols, start_utc, end_utc)
+        else:
+            df = self._request_bars(timeframe, symbols, start_utc, end_utc)
         if df.empty:
             return pd.DataFrame()
-        frame = df.reset_index().rename(columns={"timestamp": "date"})
-        frame["date"] = pd.to_datetime(frame["date"], utc=True).dt.tz_convert(None)
-        frame.rename(
-            columns={
-                "open": "open",
-                "high": "high",
-                "low": "low",
-                "close": "close",
-                "volume": "volume",
-                "trade_count": "trade_count",
-                "vwap": "vwap",
-            },
-            inplace=True,
+        # Assemble the (date, symbol) index and the output columns directly
+        # from the raw arrays rather than via rename/reindex/set_index copies.
+        dates = pd.DatetimeIndex(pd.to_datetime(df["timestamp"], utc=True))
+        index = pd.MultiIndex.from_arrays(
+            [dates.tz_convert(None), df["symbol"].to_numpy()], names=["date", "symbol"]
+        )
+        columns: dict[str, Any] = {}
+        for name in _BAR_COLUMNS:
+            source = name
+            if name == "adj_close" and name not in df.columns:
+                source = "close"
+            columns[name] = df[source].to_numpy() if source in df.columns else np.nan
+        frame = pd.DataFrame(columns, index=index)
+        frame = sort_by_index(frame)
+        # The date level leads the sorted index, so the window is a contiguous
+        # block located by binary search rather than a boolean mask.
+        dates = frame.index.get_level_values("date")
+        first = dates.searchsorted(start_utc.replace(tzinfo=None), side="left")
+        last = dates.searchsorted(end_utc.replace(tzinfo=None), side="right")
+        return frame.iloc[first:last]
+
+    def _request_bars(
+        self, timeframe: str, symbols: Sequence[str], start: datetime, end: datetime
+    ) -> pd.DataFrame:
+        """Fetch raw bars from ``/v2/stocks/bars``, paging straight into Arrow.
+
+        Each page's JSON bars become an Arrow table directly, skipping the
+        per-bar pydantic models and DataFrame assembly done by alpaca-py.
+        """
+        url = f"{self.alpaca_config.data_base_url.rstrip('/')}/v2/stocks/bars"
+        params: dict[str, Any] = {
+            "symbols": ",".join(symbols),
+            "timeframe": timeframe,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "feed": self.alpaca_config.data_feed,
+            "adjustment": _BAR_ADJUSTMENT,
+            "limit": _BARS_PAGE_LIMIT,
+        }
+        tables = []
+        while True:
+            response = self._session.get(
+                url, params=params, timeout=_BARS_TIMEOUT_SECONDS
+            )
+            response.raise_for_status()
+            payload = response.json()
+            for symbol, bars in (payload.get("bars") or {}).items():
+                if bars:
+                    tables.append(_bars_table(symbol, bars))
+            token = payload.get("next_page_token")
+            if not token:
+                break
+            params["page_token"] = token
+        if not tables:
+            return pd.DataFrame()
+        return arrow_to_pandas(pa.concat_tables(tables, promote_options="permissive"))
+
+    def _cached_bars(
+        self, timeframe: str, symbols: Sequence[str], start: datetime, end: datetime
+    ) -> pd.DataFrame:
+        """Return raw bars, fetching only the symbols the on-disk cache lacks.
+
+        Each symbol is kept in its own Parquet file whose schema metadata
+        records the windows it covers. Symbols missing from the cache or not
+        covering ``[start, end]`` are fetched in one batched request from the
+        earliest gap, merged into their files, and all symbols are then read
+        back for the requested window. Bars older than a week are final; the
+        recent tail is trusted for ``bar_cache_recent_ttl_minutes``.
+        """
+        now = datetime.now(timezone.utc)
+        ttl = timedelta(minutes=self.data_config.bar_cache_recent_ttl_minutes)
+        # Widen to whole days so runs starting at different times share coverage.
+        day_start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        cache_dir = self._bar_cache_dir()
+        paths = {symbol: cache_dir / f"{symbol}.parquet" for symbol in symbols}
+        coverage = {symbol: _read_coverage(path) for symbol, path in paths.items()}
+        gaps: dict[str, datetime] = {}
+        for symbol in symbols:
+            gap_start = _uncovered_from(coverage[symbol], day_start, end, now, ttl)
+            if gap_start is not None:
+                gaps[symbol] = gap_start
+        if gaps:
+            fetch_start = min(gaps.values())
+            fetch_end = now if end >= now - _HISTORICAL_AFTER else end
+            fetched = self._request_bars(
+                timeframe, sorted(gaps), fetch_start, fetch_end
+            )
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            for symbol in gaps:
+                rows = (
+                    fetched[fetched["symbol"] == symbol]
+                    if "symbol" in fetched.columns
+                    else fetched
+                )
+                _merge_cached_bars(
+                    paths[symbol],
+                    coverage[symbol],
+                    rows,
+                    fetch_start,
+                    fetch_end,
+                    now,
+                )
+        tables = [
+            table
+            for table in (
+                _read_cached_bars(path, day_start, end) for path in paths.values()
+            )
+            if table is not None and table.num_rows
+        ]
+        if not tables:
+            return pd.DataFrame()
+        return arrow_to_pandas(pa.concat_tables(tables, promote_options="permissive"))
+
+    def _bar_cache_dir(self) -> Path:
+        timeframe = self.data_config.timeframe or "1Day"
+        feed = str(self.alpaca_config.data_feed)
+        return (
+            Path(self.data_config.path)
+            / "cache"
+            / "alpaca"
+            / f"{timeframe}-{feed}-{_BAR_ADJUSTMENT}"
         )
-        if "adj_close" not in frame.columns:
-            frame["adj_close"] = frame["close"]
-        cols = ["date", "symbol", "open", "high", "low", "close", "adj_close", "volume"]
-        frame = frame.reindex(columns=cols)
-        start_naive = start_utc.replace(tzinfo=None)
-        end_naive = end_utc.replace(tzinfo=None)
-        frame = frame[(frame["date"] >= start_naive) & (frame["date"] <= end_naive)]
-        frame.set_index(["date", "symbol"], inplace=True)
-        return frame.sort_index()
 
     def get_fundamentals(self, symbols: Iterable[str]) -> pd.DataFrame:
         # Alpaca fundamentals require separate subscriptions; stubbed as empty for now.
@@ -201,59 +271,126 @@ class AlpacaProvider(IDataProvider):
         return self._meta
 
 
-def _ensure_urllib3_six_moves() -> None:
-    """Ensure urllib3's vendored six module exposes moves for Python 3.12."""
-    import sys
-    import types
-
-    if "urllib3.packages.six.moves" in sys.modules:
-        return
-    try:
-        import six  # type: ignore[import-untyped]
-    except Exception:
-        return
-    # Register base module alias if needed
-    sys.modules.setdefault("urllib3.packages.six", six)
-    moves = six.moves
-    module = types.ModuleType("urllib3.packages.six.moves")
-
-    def _getattr(name: str):
-        return getattr(moves, name)
-
-    def _dir():
-        return [attr for attr in dir(moves) if not attr.startswith("__")]
-
-    module.__getattr__ = _getattr  # type: ignore[method-assign]
-    module.__dir__ = _dir  # type: ignore[method-assign]
-
-    for attr in _dir():
-        try:
-            value = getattr(moves, attr)
-        except Exception:
+def _bars_table(symbol: str, bars: list[dict[str, Any]]) -> pa.Table:
+    table = pa.Table.from_pylist(bars)
+    table = table.rename_columns(
+        [_BAR_FIELDS.get(name, name) for name in table.column_names]
+    )
+    for position, name in enumerate(table.column_names):
+        if name == "timestamp":
+            column = table.column(position).cast(pa.timestamp("ns", tz="UTC"))
+        elif name in _FLOAT_BAR_COLUMNS:
+            column = table.column(position).cast(pa.float64())
+        else:
             continue
-        setattr(module, attr, value)
-        if isinstance(value, types.ModuleType):
-            sys.modules.setdefault(f"urllib3.packages.six.moves.{attr}", value)
+        table = table.set_column(position, name, column)
+    return table.add_column(0, "symbol", pa.repeat(symbol, table.num_rows))
 
-    sys.modules.setdefault("urllib3.packages.six.moves", module)
 
-    # Explicitly register common modules required by urllib3.
-    try:
-        import http.client as http_client
+_Range = tuple[datetime, datetime]
+_Coverage = tuple[list[_Range], datetime]
 
-        sys.modules.setdefault("urllib3.packages.six.moves.http_client", http_client)
-    except Exception:
-        pass
-    try:
-        import urllib.parse as urllib_parse
 
-        sys.modules.setdefault("urllib3.packages.six.moves.urllib", module.urllib)  # type: ignore[attr-defined]
-        sys.modules.setdefault("urllib3.packages.six.moves.urllib.parse", urllib_parse)
-    except Exception:
-        pass
+def _read_coverage(path: Path) -> _Coverage | None:
+    """Return ``(covered_ranges, fetched_at)`` for a symbol file."""
     try:
-        import queue as queue_mod
-
-        sys.modules.setdefault("urllib3.packages.six.moves.queue", queue_mod)
-    except Exception:
-        pass
+        metadata = pq.read_schema(path).metadata or {}
+        ranges = [
+            (datetime.fromisoformat(start), datetime.fromisoformat(end))
+            for start, end in json.loads(metadata[_COVERED_RANGES])
+        ]
+        return ranges, datetime.fromisoformat(metadata[_FETCHED_AT].decode())
+    except FileNotFoundError:
+        return None
+    except Exception:  # pragma: no cover - corrupt or older entry, refetch instead
+        return None
+
+
+def _uncovered_from(
+    coverage: _Coverage | None,
+    start: datetime,
+    end: datetime,
+    now: datetime,
+    ttl: timedelta,
+) -> datetime | None:
+    """Return where fetching must start for ``[start, end]``, or None if cached."""
+    if coverage is None:
+        return start
+    ranges, fetched_at = coverage
+    *earlier, (tail_start, tail_end) = ranges
+    if now - fetched_at >= ttl:
+        # Bars near the fetch time may have been revised since; refetch them.
+        tail_end = min(tail_end, fetched_at - _HISTORICAL_AFTER)
+    elif tail_end >= fetched_at:
+        # Fetched up to "now" within the TTL: treat the tail as current.
+        tail_end = max(tail_end, end)
+    position = start
+    for range_start, range_end in [*earlier, (tail_start, tail_end)]:
+        if range_start <= position <= range_end:
+            position = range_end
+    return None if position >= end else position
+
+
+def _merge_ranges(ranges: list[_Range]) -> list[_Range]:
+    """Union of ``ranges`` as sorted, disjoint windows."""
+    merged: list[_Range] = []
+    for range_start, range_end in sorted(ranges):
+        if merged and range_start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+        else:
+            merged.append((range_start, range_end))
+    return merged
+
+
+def _merge_cached_bars(
+    path: Path,
+    coverage: _Coverage | None,
+    rows: pd.DataFrame,
+    fetch_start: datetime,
+    fetch_end: datetime,
+    now: datetime,
+) -> None:
+    ranges: list[_Range] = [(fetch_start, fetch_end)]
+    fetched_at = now
+    if coverage is not None:
+        ranges += coverage[0]
+        if fetch_end < coverage[0][-1][1]:
+            fetched_at = coverage[1]
+    if path.exists():
+        # Fetched rows replace their window; bars outside it are kept even
+        # when the two windows do not touch.
+        existing = pd.read_parquet(path)
+        if "timestamp" in existing.columns:
+            outside = (existing["timestamp"] < fetch_start) | (
+                existing["timestamp"] > fetch_end
+            )
+            existing = existing[outside]
+        rows = pd.concat([existing, rows], ignore_index=True)
+    if "timestamp" not in rows.columns:
+        rows = rows.assign(timestamp=pd.Series(dtype="datetime64[ns, UTC]"))
+    rows = rows.drop_duplicates(subset="timestamp", keep="last").sort_values(
+        "timestamp", ignore_index=True
+    )
+    covered = [
+        [range_start.isoformat(), range_end.isoformat()]
+        for range_start, range_end in _merge_ranges(ranges)
+    ]
+    table = pa.Table.from_pandas(rows, preserve_index=False)
+    table = table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            _COVERED_RANGES: json.dumps(covered).encode(),
+            _FETCHED_AT: fetched_at.isoformat().encode(),
+        }
+    )
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def _read_cached_bars(path: Path, start: datetime, end: datetime) -> pa.Table | None:
+    if not path.exists():
+        return None
+    return pq.read_table(
+        path, filters=[("timestamp", ">=", start), ("timestamp", "<=", end)]
+    )
@@ -1,20 +1,91 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable
+from pathlib import Path
+from typing import Any, Iterable, Sequence
 
+import numpy as np
 import pandas as pd
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SymbolMeta:
     symbol: str
     sector: str | None = None
     beta: float | None = None
 
 
+def read_universe(path: str | Path) -> list[SymbolMeta]:
+    """Return symbol metadata from a universe CSV (``symbol`` and optional ``sector``).
+
+    Parsed rows are cached per resolved path and modification time, so
+    providers built repeatedly in one process read the file once.
+    """
+    universe_path = Path(path).expanduser().resolve()
+    return list(_read_universe_cached(universe_path, universe_path.stat().st_mtime_ns))
+
+
+def as_symbol_sequence(symbols: Iterable[str]) -> Sequence[str]:
+    """Return ``symbols`` as a sequence, copying only if it is not a list or tuple."""
+    if isinstance(symbols, (list, tuple)):
+        return symbols
+    return list(symbols)
+
+
+def arrow_to_pandas(table: Any) -> pd.DataFrame:
+    """Convert a throwaway ``pyarrow.Table`` to pandas at roughly half the peak memory.
+
+    Columns become separate blocks (no consolidation copy) and Arrow buffers
+    are released as each column is converted, so ``table`` must not be used
+    afterwards.
+    """
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def sort_by_index(frame: pd.DataFrame) -> pd.DataFrame:
+    """Return ``frame`` sorted by its index, skipping the sort if already ordered."""
+    if frame.index.is_monotonic_increasing:
+        return frame
+    return frame.sort_index()
+
+
+def index_by_date_symbol(
+    frame: pd.DataFrame, symbols: Sequence[str], lengths: Sequence[int]
+) -> pd.DataFrame:
+    """Index stacked per-symbol blocks by (date, symbol), sorted.
+
+    ``frame`` holds ``lengths[i]`` consecutive rows for ``symbols[i]``, and
+    ``symbols`` must not repeat. The symbol level is built from integer codes
+    repeated per block, so no per-row symbol strings are materialised or
+    hashed.
+    """
+    symbol_level = pd.Index(sorted(symbols))
+    symbol_codes = np.repeat(symbol_level.get_indexer(symbols), lengths)
+    date_codes, date_level = pd.factorize(frame.pop("date"), sort=True)
+    frame.index = pd.MultiIndex(
+        levels=[date_level, symbol_level],
+        codes=[date_codes, symbol_codes],
+        names=["date", "symbol"],
+    )
+    return sort_by_index(frame)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_universe_cached(universe_path: Path, mtime_ns: int) -> tuple[SymbolMeta, ...]:
+    df = pd.read_csv(universe_path)
+    if "symbol" not in df.columns:
+        raise ValueError(f"Universe file {universe_path} missing 'symbol' column")
+    rows = df.reindex(columns=["symbol", "sector"]).to_numpy(dtype=object)
+    # Blank sector cells arrive as NaN; NaN != NaN maps them to None.
+    return tuple(
+        SymbolMeta(str(symbol), sector if sector == sector else None)
+        for symbol, sector in rows
+    )
+
+
 class IDataProvider(ABC):
     """Interface for point-in-time market data providers."""
 
@@ -1,15 +1,67 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 
 import pandas as pd
+from pandas.tseries.holiday import (
+    AbstractHolidayCalendar,
+    GoodFriday,
+    Holiday,
+    USLaborDay,
+    USMartinLutherKingJr,
+    USMemorialDay,
+    USPresidentsDay,
+    USThanksgivingDay,
+    nearest_workday,
+    sunday_to_monday,
+)
+from pandas.tseries.offsets import CustomBusinessDay
+
+
+class NYSEHolidayCalendar(AbstractHolidayCalendar):
+    """Regular NYSE full-day holidays (unscheduled closures are not modelled)."""
+
+    rules = [
+        # NYSE does not close on Friday when New Year's Day falls on a Saturday.
+        Holiday("NewYearsDay", month=1, day=1, observance=sunday_to_monday),
+        USMartinLutherKingJr,
+        USPresidentsDay,
+        GoodFriday,
+        USMemorialDay,
+        Holiday(
+            "Juneteenth",
+            month=6,
+            day=19,
+            start_date="2022-01-01",
+            observance=nearest_workday,
+        ),
+        Holiday("IndependenceDay", month=7, day=4, observance=nearest_workday),
+        USLaborDay,
+        USThanksgivingDay,
+        Holiday("Christmas", month=12, day=25, observance=nearest_workday),
+    ]
+
+
+_NYSE_SESSION = CustomBusinessDay(calendar=NYSEHolidayCalendar())
 
 
 def trading_days(
     start: datetime, end: datetime, tz: str = "America/New_York"
 ) -> pd.DatetimeIndex:
-    """Return NYSE trading days between start and end (inclusive)."""
-    calendar = pd.date_range(start=start, end=end, freq="B", tz=tz)
+    """Return NYSE trading days between start and end (inclusive).
+
+    Sessions are cached per (start, end, tz); the returned index is shared and
+    must not be mutated.
+    """
+    return _trading_days_cached(pd.Timestamp(start), pd.Timestamp(end), tz)
+
+
+@lru_cache(maxsize=32)
+def _trading_days_cached(
+    start: pd.Timestamp, end: pd.Timestamp, tz: str
+) -> pd.DatetimeIndex:
+    calendar = pd.date_range(start=start, end=end, freq=_NYSE_SESSION, tz=tz)
     return calendar.tz_convert("UTC")
 
 
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import weakref
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 
 import pandas as pd
 
@@ -13,16 +14,55 @@ from .local_csv import LocalCSVProvider
 from .yahoo import YahooProvider
 
 
+def _universe_path(settings: Settings) -> Path:
+    return Path(settings.data.path) / settings.data.equities_universe
+
+
+PROVIDER_REGISTRY: dict[str, Callable[[Settings], IDataProvider]] = {
+    "local_csv": lambda settings: LocalCSVProvider(
+        settings.data.path, _universe_path(settings)
+    ),
+    "yahoo": lambda settings: YahooProvider(
+        str(_universe_path(settings)),
+        cache_dir=(
+            Path(settings.data.path) / "cache" / "yahoo"
+            if settings.data.bar_cache
+            else None
+        ),
+        recent_ttl_minutes=settings.data.bar_cache_recent_ttl_minutes,
+    ),
+    "alpaca": AlpacaProvider,
+}
+
+
+_PROVIDER_CACHE_SIZE = 8
+_PROVIDER_CACHE: dict[int, tuple[weakref.ref[Settings], IDataProvider]] = {}
+
+
 def build_provider(settings: Settings) -> IDataProvider:
-    data_root = Path(settings.data.path)
-    universe_path = data_root / settings.data.equities_universe
-    if settings.data.provider == "local_csv":
-        return LocalCSVProvider(data_root, universe_path)
-    if settings.data.provider == "yahoo":
-        return YahooProvider(str(universe_path))
-    if settings.data.provider == "alpaca":
-        return AlpacaProvider(settings)
-    raise ValueError(f"Unsupported data provider {settings.data.provider}")
+    """Return the data provider configured by ``settings``.
+
+    Providers are cached per Settings instance (``load_settings`` shares one
+    per unchanged config file), so repeated calls reuse the same client and
+    parsed universe. Settings must not be mutated after the first call.
+    """
+    key = id(settings)
+    entry = _PROVIDER_CACHE.get(key)
+    if entry is not None and entry[0]() is settings:
+        return entry[1]
+    try:
+        factory = PROVIDER_REGISTRY[settings.data.provider]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported data provider {settings.data.provider}"
+        ) from None
+    provider = factory(settings)
+    ref = weakref.ref(settings, lambda _: _PROVIDER_CACHE.pop(key, None))
+    _PROVIDER_CACHE[key] = (ref, provider)
+    # Providers may hold their Settings, keeping the weakref alive; bound the cache.
+    while len(_PROVIDER_CACHE) > _PROVIDER_CACHE_SIZE:
+        _PROVIDER_CACHE.pop(next(iter(_PROVIDER_CACHE)))
+    return provider
 
 
 def load_universe(settings: Settings) -> list[SymbolMeta]:
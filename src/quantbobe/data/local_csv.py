@@ -1,12 +1,38 @@
 from __future__ import annotations
 
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable, Sequence, TypeVar
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.dataset as pads
+import pyarrow.parquet as pq
 
-from .base import IDataProvider, SymbolMeta
+from .base import (
+    IDataProvider,
+    SymbolMeta,
+    arrow_to_pandas,
+    as_symbol_sequence,
+    index_by_date_symbol,
+    read_universe,
+    sort_by_index,
+)
+
+_PRICE_COLUMNS = ("open", "high", "low", "close", "adj_close")
+_MAX_LOAD_WORKERS = 32
+_INTRADAY_BATCH_ROWS = 1 << 20
+
+_T = TypeVar("_T")
+
+
+def _naive(value: datetime) -> datetime:
+    return value.replace(tzinfo=None) if value.tzinfo else value
 
 
 class LocalCSVProvider(IDataProvider):
@@ -32,39 +58,94 @@ class LocalCSVProvider(IDataProvider):
     def get_daily_bars(
         self, symbols: Iterable[str], start: datetime, end: datetime
     ) -> pd.DataFrame:
-        frames: list[pd.DataFrame] = []
-        for symbol in symbols:
-            path = self._bars_path(symbol)
-            if path.suffix == ".csv":
-                df = pd.read_csv(path, parse_dates=["date"])
-            else:
-                df = pd.read_parquet(path)
-                if "date" not in df.columns:
-                    df = df.reset_index().rename(columns={"index": "date"})
-                df["date"] = pd.to_datetime(df["date"])
-            if df.empty:
-                continue
-            if df["date"].dt.tz is not None:
-                df["date"] = df["date"].dt.tz_localize(None)
-            start_naive = start.replace(tzinfo=None) if start.tzinfo else start
-            end_naive = end.replace(tzinfo=None) if end.tzinfo else end
-            df = df[(df["date"] >= start_naive) & (df["date"] <= end_naive)].copy()
-            df["symbol"] = symbol
-            frames.append(df)
-        if not frames:
+        # Each symbol becomes one block of the (date, symbol) index, so a
+        # repeated symbol is read once rather than producing duplicate rows.
+        symbols = list(dict.fromkeys(symbols))
+        start_naive = _naive(start)
+        end_naive = _naive(end)
+        # Parse, window and concatenate in Arrow before touching pandas.
+        loaded = _map_symbols(
+            lambda symbol: self._read_bars_table(symbol, start_naive, end_naive),
+            symbols,
+        )
+        kept = [
+            (symbol, table)
+            for symbol, table in zip(symbols, loaded, strict=True)
+            if table.num_rows
+        ]
+        if not kept:
             return pd.DataFrame()
-        combined = pd.concat(frames, ignore_index=True)
-        combined.set_index(["date", "symbol"], inplace=True)
-        return combined.sort_index()
+        combined = arrow_to_pandas(
+            pa.concat_tables([table for _, table in kept], promote_options="permissive")
+        )
+        return index_by_date_symbol(
+            combined,
+            [symbol for symbol, _ in kept],
+            [table.num_rows for _, table in kept],
+        )
+
+    def _read_bars_table(self, symbol: str, start: datetime, end: datetime) -> pa.Table:
+        path = self._bars_path(symbol)
+        if path.suffix == ".csv":
+            column_types: dict[str, Any] = {"date": pa.timestamp("us")}
+            column_types.update({name: pa.float64() for name in _PRICE_COLUMNS})
+            try:
+                table = pacsv.read_csv(
+                    path,
+                    convert_options=pacsv.ConvertOptions(column_types=column_types),
+                )
+            except pa.ArrowInvalid:
+                # Dates carrying offsets or odd formats. Arrow would convert
+                # offset dates to UTC, so read them as text and let pandas
+                # keep their wall-clock time.
+                table = pacsv.read_csv(
+                    path,
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={"date": pa.string()}
+                    ),
+                )
+        else:
+            schema = pq.read_schema(path)
+            date_type = schema.field("date").type if "date" in schema.names else None
+            if date_type is not None and pa.types.is_timestamp(date_type):
+                if date_type.tz is None:
+                    # Push the date window down into the Parquet scan.
+                    low = pa.scalar(start, type=pa.timestamp("us")).cast(date_type)
+                    high = pa.scalar(end, type=pa.timestamp("us")).cast(date_type)
+                    window = (pc.field("date") >= low) & (pc.field("date") <= high)
+                    table = pq.read_table(path, filters=window)
+                else:
+                    table = pq.read_table(path)
+            else:
+                table = pa.Table.from_pandas(
+                    self._read_parquet_frame(path), preserve_index=False
+                )
+        table = _normalize_date_column(table)
+        mask = pc.and_(
+            pc.greater_equal(table["date"], pa.scalar(start, type=pa.timestamp("us"))),
+            pc.less_equal(table["date"], pa.scalar(end, type=pa.timestamp("us"))),
+        )
+        return table.filter(mask)
+
+    @staticmethod
+    def _read_parquet_frame(path: Path) -> pd.DataFrame:
+        df = pd.read_parquet(path)
+        if "date" not in df.columns:
+            df = df.reset_index().rename(columns={"index": "date"})
+        df["date"] = pd.to_datetime(df["date"])
+        return df
 
     def get_fundamentals(self, symbols: Iterable[str]) -> pd.DataFrame:
         path = self.root / "fundamentals.csv"
         if not path.exists():
             return pd.DataFrame()
-        df = pd.read_csv(path, parse_dates=["date"])
-        df = df[df["symbol"].isin(list(symbols))]
+        df, symbol_level, symbol_codes = _read_fundamentals(
+            path, path.stat().st_mtime_ns
+        )
+        wanted = symbol_level.get_indexer(as_symbol_sequence(symbols))
+        df = df.iloc[np.isin(symbol_codes, wanted[wanted >= 0])]
         df.set_index(["date", "symbol"], inplace=True)
-        return df.sort_index()
+        return sort_by_index(df)
 
     def get_intraday_bars(
         self, symbols: Iterable[str], start: datetime, end: datetime
@@ -72,15 +153,78 @@ class LocalCSVProvider(IDataProvider):
         path = self.root / "intraday.parquet"
         if not path.exists():
             return pd.DataFrame()
-        df = pd.read_parquet(path)
-        df = df[(df["timestamp"] >= start) & (df["timestamp"] <= end)]
-        df = df[df["symbol"].isin(list(symbols))]
+        symbols = as_symbol_sequence(symbols)
+        if not symbols:
+            return pd.DataFrame()
+        df = _scan_intraday(path, symbols, start, end)
         df.set_index(["timestamp", "symbol"], inplace=True)
-        return df.sort_index()
+        return sort_by_index(df)
 
     def get_symbol_meta(self) -> list[SymbolMeta]:
-        df = pd.read_csv(self.universe_file)
-        return [
-            SymbolMeta(symbol=row.symbol, sector=getattr(row, "sector", None))
-            for row in df.itertuples()
-        ]
+        return read_universe(self.universe_file)
+
+
+def _scan_intraday(
+    path: Path, symbols: Sequence[str], start: datetime, end: datetime
+) -> pd.DataFrame:
+    """Stream matching intraday rows batch by batch.
+
+    The dataset scanner skips row groups using their statistics and filters
+    each record batch as it is decoded, so peak memory tracks the result and
+    one batch rather than the whole file.
+    """
+    timestamp = pc.field("timestamp")
+    condition = (
+        (timestamp >= pa.scalar(start))
+        & (timestamp <= pa.scalar(end))
+        & pc.field("symbol").isin(symbols)
+    )
+    scanner = pads.dataset(path, format="parquet").scanner(
+        filter=condition, batch_size=_INTRADAY_BATCH_ROWS
+    )
+    return arrow_to_pandas(scanner.to_table())
+
+
+def _map_symbols(load: Callable[[str], _T], symbols: Sequence[str]) -> list[_T]:
+    """Run ``load`` for each symbol on a thread pool, preserving order.
+
+    The CSV and Parquet readers release the GIL while parsing, so per-file
+    loads overlap on both IO and CPU.
+    """
+    if len(symbols) <= 1:
+        return [load(symbol) for symbol in symbols]
+    with ThreadPoolExecutor(max_workers=min(_MAX_LOAD_WORKERS, len(symbols))) as pool:
+        return list(pool.map(load, symbols))
+
+
+@functools.lru_cache(maxsize=4)
+def _read_fundamentals(
+    path: Path, mtime_ns: int
+) -> tuple[pd.DataFrame, pd.Index, np.ndarray]:
+    """Parse ``fundamentals.csv`` once, with its symbol column factorised.
+
+    The cached frame is shared: callers must only derive new frames from it.
+    Filtering by symbol then compares integer codes instead of hashing every
+    row's symbol string on each call.
+    """
+    df = pd.read_csv(path, parse_dates=["date"])
+    symbol_codes, symbol_level = pd.factorize(df["symbol"])
+    return df, symbol_level, symbol_codes
+
+
+def _normalize_date_column(table: pa.Table) -> pa.Table:
+    """Return ``table`` with a tz-naive ``timestamp[us]`` date column."""
+    position = table.schema.get_field_index("date")
+    column = table.column(position)
+    if pa.types.is_timestamp(column.type) and column.type.tz is not None:
+        # Keep wall-clock time, matching ``Series.dt.tz_localize(None)``.
+        column = pc.local_timestamp(column)
+    elif not pa.types.is_timestamp(column.type) and not pa.types.is_date(column.type):
+        parsed = pd.to_datetime(column.to_pandas())
+        if parsed.dt.tz is not None:
+            parsed = parsed.dt.tz_localize(None)
+        column = pa.chunked_array([pa.array(parsed)])
+    if column.type != pa.timestamp("us"):
+        column = column.cast(pa.timestamp("us"), safe=False)
+    # Drop pandas metadata so ``to_pandas`` does not restore the original tz.
+    return table.set_column(position, "date", column).replace_schema_metadata(None)
@@ -1,18 +1,40 @@
 from __future__ import annotations
 
+import functools
+import heapq
+import json
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
 
 import requests  # type: ignore[import-untyped]
 from dotenv import load_dotenv
 from loguru import logger
+from requests.adapters import HTTPAdapter  # type: ignore[import-untyped]
+from urllib3.util.retry import Retry
+
+try:  # pragma: no cover - optional dependency import
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+except Exception:  # pragma: no cover - import fallback if package missing
+    _json_loads = json.loads
 
 load_dotenv()
 
+_FINNHUB_BASE_URL = "https://finnhub.io"
+_NEWSAPI_BASE_URL = "https://newsapi.org"
+_MAX_FETCH_WORKERS = 8
+
+_CacheEntry = tuple[datetime, List["NewsArticle"]]
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NewsArticle:
     source: str
     headline: str
@@ -30,6 +52,7 @@ class NewsFetcher:
         company_headlines: int = 1,
         general_headlines: int = 3,
         refresh_minutes: int = 60,
+        cache_dir: str | Path | None = None,
     ) -> None:
         self._finnhub_key = os.getenv("FINNHUB_API_KEY")
         self._newsapi_key = os.getenv("NEWSAPI_KEY")
@@ -37,8 +60,25 @@ class NewsFetcher:
         self._company_headlines = max(company_headlines, 0)
         self._general_headlines = max(general_headlines, 0)
         self._refresh = timedelta(minutes=max(refresh_minutes, 1))
-        self._company_cache: Dict[str, tuple[datetime, List[NewsArticle]]] = {}
-        self._general_cache: Optional[tuple[datetime, List[NewsArticle]]] = None
+        self._company_cache: Dict[str, _CacheEntry] = {}
+        self._general_cache: Optional[_CacheEntry] = None
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._newsapi_headers = {"X-Api-Key": self._newsapi_key or ""}
+
+    @cached_property
+    def _session(self) -> requests.Session:
+        """HTTP session keeping keep-alive connections to both news hosts."""
+        session = requests.Session()
+        for base_url in (_FINNHUB_BASE_URL, _NEWSAPI_BASE_URL):
+            session.mount(
+                base_url,
+                HTTPAdapter(
+                    pool_connections=4,
+                    pool_maxsize=16,
+                    max_retries=Retry(total=2, backoff_factor=0.2),
+                ),
+            )
+        return session
 
     def get_company_headlines(self, symbols: List[str]) -> Dict[str, List[NewsArticle]]:
         now = datetime.now(timezone.utc)
@@ -46,16 +86,25 @@ class NewsFetcher:
         if not self._finnhub_key or self._company_headlines <= 0:
             return results
 
+        stale: List[str] = []
         for symbol in symbols:
             cached = self._company_cache.get(symbol)
-            if cached and now - cached[0] < self._refresh:
+            if not self._is_fresh(cached, now):
+                cached = self._read_cached(f"company-{symbol}")
+                if cached:
+                    self._company_cache[symbol] = cached
+            if cached and self._is_fresh(cached, now):
                 results[symbol] = cached[1][: self._company_headlines]
-                continue
-            articles = self._fetch_finnhub_company_news(symbol)
+            else:
+                stale.append(symbol)
+        fetched = self._fetch_company_news(stale, now)
+        for symbol, articles in zip(stale, fetched, strict=True):
             if articles:
                 self._company_cache[symbol] = (now, articles)
+                self._write_cached(f"company-{symbol}", (now, articles))
                 results[symbol] = articles[: self._company_headlines]
-        return results
+        # Keep the caller's symbol order regardless of which came from cache.
+        return {symbol: results[symbol] for symbol in symbols if symbol in results}
 
     def get_market_headlines(self) -> List[NewsArticle]:
         now = datetime.now(timezone.utc)
@@ -63,41 +112,103 @@ class NewsFetcher:
             return []
 
         cached = self._general_cache
-        if cached and now - cached[0] < self._refresh:
+        if not self._is_fresh(cached, now):
+            cached = self._general_cache = self._read_cached("general")
+        if cached and self._is_fresh(cached, now):
             return cached[1][: self._general_headlines]
 
         articles = self._fetch_newsapi_headlines()
         if articles:
             self._general_cache = (now, articles)
+            self._write_cached("general", (now, articles))
         return articles[: self._general_headlines]
 
-    def _fetch_finnhub_company_news(self, symbol: str) -> List[NewsArticle]:
+    def _is_fresh(self, entry: Optional[_CacheEntry], now: datetime) -> bool:
+        return entry is not None and now - entry[0] < self._refresh
+
+    def _read_cached(self, key: str) -> Optional[_CacheEntry]:
+        """Return the on-disk cache entry for ``key``, if one was persisted."""
+        if self._cache_dir is None:
+            return None
+        try:
+            with (self._cache_dir / f"{key}.pkl").open("rb") as handle:
+                return pickle.load(handle)
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            # Truncated files and entries pickled by an older layout of
+            # NewsArticle are both just cache misses.
+            logger.warning("Ignoring unreadable news cache entry {}: {}", key, exc)
+            return None
+
+    def _write_cached(self, key: str, entry: _CacheEntry) -> None:
+        """Persist ``entry`` so fresh headlines survive process restarts."""
+        if self._cache_dir is None:
+            return
+        path = self._cache_dir / f"{key}.pkl"
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as handle:
+                pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            logger.warning("Failed to persist news cache entry {}: {}", key, exc)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _fetch_company_news(
+        self, symbols: List[str], now: datetime
+    ) -> List[List[NewsArticle]]:
+        """Fetch Finnhub news for ``symbols`` concurrently, preserving order.
+
+        Each fetch blocks on a network round-trip with the GIL released, so
+        the requests overlap on a small thread pool sharing one session. The
+        date window is the same for every symbol and is formatted once.
+        """
+        fetch = functools.partial(
+            self._fetch_finnhub_company_news,
+            start=(now - self._lookback).strftime("%Y-%m-%d"),
+            end=now.strftime("%Y-%m-%d"),
+        )
+        if len(symbols) <= 1:
+            return [fetch(symbol) for symbol in symbols]
+        workers = min(_MAX_FETCH_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fetch, symbols))
+
+    def _fetch_finnhub_company_news(
+        self, symbol: str, start: str, end: str
+    ) -> List[NewsArticle]:
         if not self._finnhub_key:
             return []
-        end = datetime.utcnow()
-        start = end - self._lookback
         params = {
             "symbol": symbol,
-            "from": start.strftime("%Y-%m-%d"),
-            "to": end.strftime("%Y-%m-%d"),
+            "from": start,
+            "to": end,
             "token": self._finnhub_key,
         }
         try:
-            resp = requests.get(
-                "https://finnhub.io/api/v1/company-news",
+            resp = self._session.get(
+                f"{_FINNHUB_BASE_URL}/api/v1/company-news",
                 params=params,
                 timeout=10,
             )
             resp.raise_for_status()
-            payload = resp.json()
+            payload = _json_loads(resp.content)
         except Exception as exc:  # pragma: no cover - network failure paths
             logger.warning("Finnhub news fetch failed for %s: %s", symbol, exc)
             return []
         articles: List[NewsArticle] = []
+        # Bursts of articles share a timestamp; convert each epoch only once.
+        timestamps: Dict[int, datetime] = {}
         for item in payload or []:
-            published = datetime.fromtimestamp(
-                item.get("datetime", 0), tz=timezone.utc
-            )
+            epoch = item.get("datetime", 0)
+            published = timestamps.get(epoch)
+            if published is None:
+                published = timestamps[epoch] = datetime.fromtimestamp(
+                    epoch, tz=timezone.utc
+                )
             articles.append(
                 NewsArticle(
                     source=(item.get("source") or "Finnhub"),
@@ -107,7 +218,10 @@ class NewsFetcher:
                     summary=item.get("summary"),
                 )
             )
-        return sorted(articles, key=lambda a: a.published_at, reverse=True)
+        # Only the newest few are ever served; keep those instead of sorting all.
+        return heapq.nlargest(
+            self._company_headlines, articles, key=lambda a: a.published_at
+        )
 
     def _fetch_newsapi_headlines(self) -> List[NewsArticle]:
         if not self._newsapi_key:
@@ -117,30 +231,31 @@ class NewsFetcher:
             "language": "en",
             "pageSize": str(max(self._general_headlines, 3)),
         }
-        headers = {"X-Api-Key": self._newsapi_key}
         try:
-            resp = requests.get(
-                "https://newsapi.org/v2/top-headlines",
+            resp = self._session.get(
+                f"{_NEWSAPI_BASE_URL}/v2/top-headlines",
                 params=params,
-                headers=headers,
+                headers=self._newsapi_headers,
                 timeout=10,
             )
             resp.raise_for_status()
-            payload = resp.json()
+            payload = _json_loads(resp.content)
         except Exception as exc:  # pragma: no cover - network failure paths
             logger.warning("NewsAPI fetch failed: %s", exc)
             return []
         articles: List[NewsArticle] = []
+        fetched_at = datetime.now(timezone.utc)
         for item in payload.get("articles", []):
             published_raw = item.get("publishedAt")
             try:
+                # Python 3.11+ parses the trailing "Z" of ISO 8601 natively.
                 published = (
-                    datetime.fromisoformat(published_raw.replace("Z", "+00:00"))
+                    datetime.fromisoformat(published_raw)
                     if published_raw
-                    else datetime.now(timezone.utc)
+                    else fetched_at
                 )
-            except Exception:
-                published = datetime.now(timezone.utc)
+            except (TypeError, ValueError):
+                published = fetched_at
             articles.append(
                 NewsArticle(
                     source=(item.get("source") or {}).get("name", "NewsAPI"),
@@ -150,4 +265,6 @@ class NewsFetcher:
                     summary=item.get("description"),
                 )
             )
-        return sorted(articles, key=lambda a: a.published_at, reverse=True)
+        return heapq.nlargest(
+            self._general_headlines, articles, key=lambda a: a.published_at
+        )
@@ -1,102 +1,205 @@
 from __future__ import annotations
 
-from datetime import datetime
-from functools import lru_cache
-from typing import Iterable
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
 import yfinance as yf
 
-from .base import IDataProvider, SymbolMeta
+from .base import (
+    IDataProvider,
+    SymbolMeta,
+    index_by_date_symbol,
+    read_universe,
+    sort_by_index,
+)
 
+# Daily bars ending more than this long ago are treated as final.
+_HISTORICAL_AFTER = timedelta(days=7)
+_MAX_FUNDAMENTALS_WORKERS = 8
 
-@lru_cache(maxsize=32)
-def _download_daily_cached(symbol: str, start: str, end: str) -> pd.DataFrame:
-    return yf.download(symbol, start=start, end=end, progress=False, auto_adjust=False)
+
+def _download_daily_batch(symbols: list[str], start: str, end: str) -> pd.DataFrame:
+    # One batched call; yfinance fetches the tickers on its own thread pool.
+    return yf.download(
+        symbols,
+        start=start,
+        end=end,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+        auto_adjust=False,
+    )
+
+
+def _ticker_frame(data: pd.DataFrame, symbol: str) -> pd.DataFrame:
+    """Slice one ticker's price columns out of a batched download."""
+    if data.empty or symbol not in data.columns.get_level_values("Ticker"):
+        return pd.DataFrame()
+    frame = data.xs(symbol, axis=1, level="Ticker")
+    # Batched downloads align all tickers on one date index; drop the padding.
+    return frame.dropna(how="all").sort_index(axis=1)
+
+
+def _stack_frames(frames: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    """Stack per-symbol downloads into one (date, symbol)-indexed frame.
+
+    Each output column is allocated once at the total row count and every
+    symbol's block is written into its slice, instead of concatenating and
+    re-indexing whole frames.
+    """
+    blocks = list(frames.values())
+    lengths = [len(df) for df in blocks]
+    bounds = np.cumsum([0, *lengths])
+    columns = list(dict.fromkeys(c for df in blocks for c in df.columns))
+    data: dict[str, np.ndarray] = {}
+    for column in columns:
+        dtypes = [df[column].dtype for df in blocks if column in df.columns]
+        if len(dtypes) < len(blocks):
+            dtypes.append(np.dtype(np.float64))  # missing blocks are NaN-filled
+        values = np.empty(bounds[-1], dtype=np.result_type(*dtypes))
+        for df, lo, hi in zip(blocks, bounds[:-1], bounds[1:], strict=True):
+            values[lo:hi] = df[column].to_numpy() if column in df.columns else np.nan
+        data[column] = values
+    frame = pd.DataFrame(data, copy=False)
+    frame.columns.name = blocks[0].columns.name
+    # Convert timezone-aware datetimes to naive for comparison
+    frame["date"] = np.concatenate(
+        [
+            (
+                df.index.tz_localize(None) if df.index.tz is not None else df.index
+            ).to_numpy()
+            for df in blocks
+        ]
+    )
+    return index_by_date_symbol(frame, list(frames), lengths)
+
+
+def _financials(ticker: Any) -> pd.DataFrame | None:
+    """Return a ticker's income statement with one row per statement date."""
+    try:
+        fundamentals = ticker.financials.T
+    except Exception:  # pragma: no cover - API variability
+        return None
+    return None if fundamentals.empty else fundamentals
 
 
 class YahooProvider(IDataProvider):
     """Thin wrapper around yfinance with point-in-time safeguards."""
 
-    def __init__(self, universe_path: str) -> None:
+    def __init__(
+        self,
+        universe_path: str,
+        cache_dir: str | Path | None = None,
+        recent_ttl_minutes: float = 15.0,
+    ) -> None:
         self.universe_path = universe_path
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.recent_ttl = timedelta(minutes=recent_ttl_minutes)
         self._meta = self._load_meta()
 
-    def _download_daily(self, symbol: str, start: str, end: str) -> pd.DataFrame:
-        return _download_daily_cached(symbol, start, end)
+    def _download_daily(
+        self, symbols: list[str], start: str, end: str
+    ) -> dict[str, pd.DataFrame]:
+        """Return each symbol's daily download, fetching all misses in one call.
+
+        With a ``cache_dir`` every symbol is first served from its Parquet
+        copy: windows ending more than a week ago are final and kept
+        indefinitely, windows reaching the present expire after ``recent_ttl``.
+        """
+        frames: dict[str, pd.DataFrame] = {}
+        missing: list[str] = []
+        for symbol in symbols:
+            path = self._cache_path(symbol, start, end)
+            if path is not None and path.exists() and self._is_fresh(path, end):
+                frames[symbol] = pd.read_parquet(path)
+            else:
+                missing.append(symbol)
+        if missing:
+            data = _download_daily_batch(missing, start, end)
+            for symbol in missing:
+                frame = _ticker_frame(data, symbol)
+                frames[symbol] = frame
+                path = self._cache_path(symbol, start, end)
+                if path is not None and not frame.empty:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                    frame.to_parquet(tmp_path)
+                    os.replace(tmp_path, path)
+        return frames
+
+    def _cache_path(self, symbol: str, start: str, end: str) -> Path | None:
+        if self.cache_dir is None:
+            return None
+        return self.cache_dir / f"{symbol}_{start}_{end}.parquet"
+
+    def _is_fresh(self, path: Path, end: str) -> bool:
+        if pd.Timestamp(end) < pd.Timestamp.now().normalize() - _HISTORICAL_AFTER:
+            return True
+        age = time.time() - path.stat().st_mtime
+        return age < self.recent_ttl.total_seconds()
 
     def _load_meta(self) -> list[SymbolMeta]:
-        df = pd.read_csv(self.universe_path)
-        return [
-            SymbolMeta(
-                symbol=row.symbol, sector=row.sector if hasattr(row, "sector") else None
-            )
-            for row in df.itertuples()
-        ]
+        return read_universe(self.universe_path)
 
     def get_daily_bars(
         self, symbols: Iterable[str], start: datetime, end: datetime
     ) -> pd.DataFrame:
-        frames: list[pd.DataFrame] = []
-        for symbol in symbols:
-            # Use simple date strings instead of ISO format
-            start_str = start.strftime("%Y-%m-%d")
-            end_str = end.strftime("%Y-%m-%d")
-            df = self._download_daily(symbol, start_str, end_str)
-            if df.empty:
-                continue
-            # Flatten multi-level columns
-            df.columns = df.columns.get_level_values(0).str.lower()
-            df["symbol"] = symbol
-            df = df.reset_index()
-            # The index column is named 'Date' after reset_index, rename it to 'date'
-            if "Date" in df.columns:
-                df = df.rename(columns={"Date": "date"})
-            elif "index" in df.columns:
-                df = df.rename(columns={"index": "date"})
-            # Ensure date column is datetime
-            df["date"] = pd.to_datetime(df["date"])
-            if "adj close" in df.columns:
-                df = df.rename(columns={"adj close": "adj_close"})
-            frames.append(df)
+        # Use simple date strings instead of ISO format
+        downloads = self._download_daily(
+            list(symbols), start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+        )
+        frames = {symbol: df for symbol, df in downloads.items() if not df.empty}
         if not frames:
             return pd.DataFrame()
-        combined = pd.concat(frames, ignore_index=True)
-        # Convert timezone-aware datetimes to naive for comparison
-        if combined["date"].dt.tz is not None:
-            combined["date"] = combined["date"].dt.tz_localize(None)
-        # Ensure start and end are also timezone-naive
+        combined = _stack_frames(frames)
+        combined.columns = combined.columns.str.lower()
+        if "adj close" in combined.columns:
+            combined = combined.rename(columns={"adj close": "adj_close"})
+        # Ensure start and end are also timezone-naive. The date level leads
+        # the sorted index, so the window is located by binary search rather
+        # than a boolean mask over every row.
         start_naive = start.replace(tzinfo=None) if start.tzinfo else start
         end_naive = end.replace(tzinfo=None) if end.tzinfo else end
-        combined = combined[
-            (combined["date"] >= start_naive) & (combined["date"] <= end_naive)
-        ]
-        combined.set_index(["date", "symbol"], inplace=True)
-        return combined.sort_index()
+        dates = combined.index.get_level_values("date")
+        first = dates.searchsorted(start_naive, side="left")
+        last = dates.searchsorted(end_naive, side="right")
+        return combined.iloc[first:last]
 
     def get_fundamentals(self, symbols: Iterable[str]) -> pd.DataFrame:
-        records: list[pd.DataFrame] = []
-        for symbol in symbols:
-            ticker = yf.Ticker(symbol)
-            try:
-                fundamentals = ticker.financials.T
-                if fundamentals.empty:
-                    continue
-                fundamentals.index = pd.to_datetime(fundamentals.index)
-                fundamentals["symbol"] = symbol
-                fundamentals = fundamentals.reset_index().rename(
-                    columns={"index": "date"}
-                )
-                fundamentals = fundamentals.sort_values("date")
-                fundamentals["date"] = fundamentals["date"] + pd.Timedelta(days=5)
-                records.append(fundamentals)
-            except Exception:  # pragma: no cover - API variability
-                continue
-        if not records:
+        symbols = list(symbols)
+        if not symbols:
+            return pd.DataFrame()
+        tickers = yf.Tickers(symbols).tickers
+        # Each statement is its own HTTP request; overlap them on a small pool.
+        workers = min(_MAX_FUNDAMENTALS_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            statements = pool.map(
+                lambda symbol: _financials(tickers[symbol.upper()]), symbols
+            )
+            frames = {
+                symbol: frame
+                for symbol, frame in zip(symbols, statements, strict=True)
+                if frame is not None
+            }
+        if not frames:
             return pd.DataFrame()
-        df = pd.concat(records, ignore_index=True)
-        df.set_index(["date", "symbol"], inplace=True)
-        return df.sort_index()
+        df = pd.concat(frames, names=["symbol", "date"])
+        # Statement dates are ISO strings or timestamps; the explicit format
+        # keeps string labels off the per-row dateutil fallback. Fundamentals
+        # become public five days after the statement date.
+        dates = pd.to_datetime(
+            df.index.get_level_values("date"), format="ISO8601", cache=True
+        ) + pd.Timedelta(days=5)
+        df.index = pd.MultiIndex.from_arrays(
+            [dates, df.index.get_level_values("symbol")], names=["date", "symbol"]
+        )
+        return sort_by_index(df)
 
     def get_intraday_bars(
         self, symbols: Iterable[str], start: datetime, end: datetime
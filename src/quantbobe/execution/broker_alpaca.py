@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import inspect
+import math
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from decimal import ROUND_HALF_UP, Decimal
-from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, cast
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional, cast
 
 from dotenv import load_dotenv
 from loguru import logger
@@ -30,10 +33,75 @@ except Exception:  # pragma: no cover - import fallback if package missing
     MarketOrderRequest = cast(Any, None)  # type: ignore[misc]
     _ALPACA_PY_AVAILABLE = False
 
+# Constructor keywords differ across alpaca-py releases; resolve them once.
+_TRADING_CLIENT_PARAMS: frozenset[str] = (
+    frozenset(inspect.signature(TradingClient.__init__).parameters)
+    if _ALPACA_PY_AVAILABLE
+    else frozenset()
+)
+
+
+def _trading_client_builder(
+    params: frozenset[str],
+) -> Callable[[str, str, str], Any]:
+    """Return a ``TradingClient`` factory specialised to ``params``.
+
+    The calling convention (which credentials are keywords, whether ``paper``
+    is accepted and how the base URL is named) is decided here, once, so
+    constructing a broker only fills in the values.
+    """
+    key_keyword = "api_key" in params
+    secret_keyword = key_keyword and "secret_key" in params
+    paper_keyword = "paper" in params
+    url_keyword = next(
+        (name for name in ("url_override", "base_url") if name in params), None
+    )
+
+    def build(api_key: str, api_secret: str, base_url: str) -> Any:
+        args: list[Any] = [] if key_keyword else [api_key]
+        kwargs: Dict[str, Any] = {"api_key": api_key} if key_keyword else {}
+        if secret_keyword:
+            kwargs["secret_key"] = api_secret
+        else:
+            args.append(api_secret)
+        if paper_keyword:
+            kwargs["paper"] = "paper" in base_url.lower()
+        if url_keyword is not None:
+            kwargs[url_keyword] = base_url
+        return TradingClient(*args, **kwargs)
+
+    return build
+
+
+_build_trading_client = _trading_client_builder(_TRADING_CLIENT_PARAMS)
+
+# Read .env once per process rather than on every broker construction.
+load_dotenv()
+
 if TYPE_CHECKING:  # pragma: no cover - type checking only
     from ..config.schema import AlpacaConfig
 
 
+_CENT = Decimal("0.01")
+
+
+def _round_cents(price: float) -> float:
+    """Round ``price`` to whole cents, halves away from zero.
+
+    Matches ``Decimal(str(price)).quantize(Decimal("0.01"), ROUND_HALF_UP)``.
+    Float arithmetic settles every price except those within a few ulps of a
+    half cent, such as ``1.005 * 100 == 100.49999999999999``; only those are
+    rounded through the decimal they print as.
+    """
+    cents = abs(price) * 100.0
+    if abs(cents - math.floor(cents) - 0.5) > 8 * math.ulp(cents):
+        rounded = math.floor(cents + 0.5)
+    else:
+        exact = Decimal(str(abs(price))).quantize(_CENT, ROUND_HALF_UP)
+        rounded = int(exact.scaleb(2))
+    return math.copysign(rounded / 100.0, price)
+
+
 @dataclass
 class OrderTicket:
     symbol: str
@@ -42,12 +110,42 @@ class OrderTicket:
     type: str = "limit"
     limit_price: Optional[float] = None
 
+    def __post_init__(self) -> None:
+        # Canonicalise once so submission can dispatch on the raw strings.
+        self.side = self.side.lower()
+        self.type = self.type.lower()
+
+
+def _market_request(order: OrderTicket, qty: float, side: Any) -> Any:
+    return MarketOrderRequest(
+        symbol=order.symbol, qty=qty, side=side, time_in_force=TimeInForce.DAY
+    )
+
+
+def _limit_request(order: OrderTicket, qty: float, side: Any) -> Any:
+    if order.limit_price is None:
+        raise ValueError("Limit price required for limit orders")
+    return LimitOrderRequest(
+        symbol=order.symbol,
+        qty=qty,
+        side=side,
+        limit_price=_round_cents(order.limit_price),
+        time_in_force=TimeInForce.DAY,
+    )
+
+
+_MAX_SUBMIT_WORKERS = 4
+
+_REQUEST_BUILDERS = {"market": _market_request, "limit": _limit_request}
+_ORDER_SIDES: Dict[str, Any] = (
+    {"buy": OrderSide.BUY, "sell": OrderSide.SELL} if _ALPACA_PY_AVAILABLE else {}
+)
+
 
 class AlpacaBroker:
     """Alpaca trading client wrapper using alpaca-py."""
 
     def __init__(self, config: Optional["AlpacaConfig"] = None) -> None:
-        load_dotenv()
         self._config = config
         self._key_env = config.key_env if config else "ALPACA_API_KEY_ID"
         self._secret_env = config.secret_env if config else "ALPACA_API_SECRET_KEY"
@@ -71,28 +169,7 @@ class AlpacaBroker:
             return None
         if _ALPACA_PY_AVAILABLE and TradingClient is not None:
             try:
-                import inspect
-
-                paper_mode = "paper" in self._base_url.lower()
-                params = inspect.signature(TradingClient.__init__).parameters
-                call_args: list[str] = []
-                call_kwargs: Dict[str, object] = {}
-                if "api_key" in params:
-                    call_kwargs["api_key"] = api_key
-                    if "secret_key" in params:
-                        call_kwargs["secret_key"] = api_secret
-                    else:
-                        call_args.append(api_secret)
-                else:
-                    call_args.extend([api_key, api_secret])
-                if "paper" in params:
-                    call_kwargs["paper"] = paper_mode
-                if "url_override" in params:
-                    call_kwargs["url_override"] = self._base_url
-                elif "base_url" in params:
-                    call_kwargs["base_url"] = self._base_url
-                client = TradingClient(*call_args, **call_kwargs)
-                return client
+                return _build_trading_client(api_key, api_secret, self._base_url)
             except Exception as exc:  # pragma: no cover - defensive guard
                 logger.exception("Failed to initialise Alpaca TradingClient: %s", exc)
         logger.warning("No Alpaca client available; running in dry mode.")
@@ -158,11 +235,11 @@ class AlpacaBroker:
         if self._client is None:
             logger.info("Dry-run orders: {}", orders)
             return
+        valid_orders: list[tuple[OrderTicket, float]] = []
         for order in orders:
             qty = abs(float(order.qty))
             if qty < 1e-4:
                 continue
-            side = order.side.lower()
             participation = min(qty / 1_000_000.0, 1.0)
             if participation > 0.05:
                 logger.warning(
@@ -171,48 +248,36 @@ class AlpacaBroker:
                     order.symbol,
                 )
                 continue
-            try:
-                self._submit_order(order, qty, side)
-                logger.info(
-                    "Submitted %s %s shares of %s", order.side, qty, order.symbol
-                )
-            except Exception as exc:  # pragma: no cover - network/API errors
-                logger.exception("Failed to submit order for %s: %s", order.symbol, exc)
+            valid_orders.append((order, qty))
+        if len(valid_orders) <= 1:
+            for order, qty in valid_orders:
+                self._safe_submit(order, qty)
+            return
+        # Submissions are independent HTTP round-trips; overlap a few at a time
+        # while staying well inside the API rate limit.
+        workers = min(_MAX_SUBMIT_WORKERS, len(valid_orders))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(lambda item: self._safe_submit(*item), valid_orders))
+
+    def _safe_submit(self, order: OrderTicket, qty: float) -> None:
+        try:
+            self._submit_order(order, qty, order.side)
+            logger.info("Submitted %s %s shares of %s", order.side, qty, order.symbol)
+        except Exception as exc:  # pragma: no cover - network/API errors
+            logger.exception("Failed to submit order for %s: %s", order.symbol, exc)
 
     def _submit_order(self, order: OrderTicket, qty: float, side: str) -> None:
         if self._client is None:
             raise RuntimeError("No Alpaca client configured")
-        order_type = order.type.lower()
-        if TimeInForce is None or OrderSide is None:
-            raise RuntimeError("alpaca-py TimeInForce/OrderSide enums unavailable")
-        tif = TimeInForce.DAY
-        if order_type == "market":
-            if MarketOrderRequest is None:
-                raise RuntimeError("alpaca-py MarketOrderRequest unavailable")
-            request_obj: object = MarketOrderRequest(
-                symbol=order.symbol,
-                qty=qty,
-                side=OrderSide(side),
-                time_in_force=tif,
-            )
-        elif order_type == "limit":
-            if order.limit_price is None:
-                raise ValueError("Limit price required for limit orders")
-            price = Decimal(str(order.limit_price)).quantize(
-                Decimal("0.01"), rounding=ROUND_HALF_UP
-            )
-            if LimitOrderRequest is None:
-                raise RuntimeError("alpaca-py LimitOrderRequest unavailable")
-            request_obj = LimitOrderRequest(
-                symbol=order.symbol,
-                qty=qty,
-                side=OrderSide(side),
-                limit_price=float(price),
-                time_in_force=tif,
-            )
-        else:
+        if not _ALPACA_PY_AVAILABLE:
+            raise RuntimeError("alpaca-py order requests unavailable")
+        builder = _REQUEST_BUILDERS.get(order.type)
+        if builder is None:
             raise ValueError(f"Unsupported order type '{order.type}'")
-        self._client.submit_order(request_obj)
+        order_side = _ORDER_SIDES.get(side)
+        if order_side is None:
+            raise ValueError(f"Unsupported order side '{side}'")
+        self._client.submit_order(builder(order, qty, order_side))
 
     def market_clock(self):
         if self._client is None:
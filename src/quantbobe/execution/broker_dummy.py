@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -16,10 +17,16 @@ class DummyBroker:
         self.positions[symbol] = self.positions.get(symbol, 0.0) + quantity
 
     def mark_to_market(self, prices: pd.Series) -> float:
-        equity = self.cash
-        for symbol, qty in self.positions.items():
-            equity += qty * prices.get(symbol, 0.0)
-        return equity
+        if not self.positions:
+            return self.cash
+        # One aligned dot product instead of a per-symbol price lookup.
+        qty = np.fromiter(
+            self.positions.values(), dtype=float, count=len(self.positions)
+        )
+        marks = prices.reindex(list(self.positions), fill_value=0.0).to_numpy(
+            dtype=float
+        )
+        return self.cash + float(qty @ marks)
 
     def snapshot(self) -> dict[str, float]:
         return {"cash": self.cash, **self.positions}
@@ -1,59 +1,60 @@
 from __future__ import annotations
 
-import math
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import List
 
+import numpy as np
 import pandas as pd
 
 from .broker_alpaca import OrderTicket
 from .slippage import SlippageModel
 
 
-@dataclass
-class OrderSlice:
-    symbol: str
-    target: float
-    current: float
-    price: float
+@dataclass(slots=True)
+class OrderSlices:
+    """Reconciled targets for one rebalance, one array element per symbol."""
+
+    symbol: np.ndarray
+    target: np.ndarray
+    current: np.ndarray
+    price: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.symbol)
 
 
 class ExecutionRouter:
     def __init__(self, slippage: SlippageModel) -> None:
         self.slippage = slippage
 
-    def build_orders(
-        self, slices: Iterable[OrderSlice], equity: float
-    ) -> List[OrderTicket]:
-        tickets: list[OrderTicket] = []
-        for slc in slices:
-            notional = equity * (slc.target - slc.current)
-            if abs(notional) < 1.0:
-                continue
-            side = "buy" if notional > 0 else "sell"
-            base_qty = abs(notional) / max(slc.price, 1e-4)
-            if side == "sell":
-                current_qty = max(equity * slc.current / max(slc.price, 1e-4), 0.0)
-                closing_qty = min(base_qty, current_qty)
-                short_qty = max(base_qty - closing_qty, 0.0)
-                short_whole = math.floor(short_qty + 1e-9)
-                qty = closing_qty + short_whole
-                if qty <= 1e-6:
-                    continue
-            else:
-                qty = base_qty
-            participation = min(abs(base_qty) / 1_000_000, 1.0)
-            cost = self.slippage.estimate_cost(participation)
-            limit_price = slc.price * (1 + cost if side == "buy" else 1 - cost)
-            ticket = OrderTicket(
-                symbol=slc.symbol,
-                qty=qty,
-                side=side,
+    def build_orders(self, slices: OrderSlices, equity: float) -> List[OrderTicket]:
+        if not len(slices):
+            return []
+        price = slices.price
+        safe_price = np.maximum(price, 1e-4)
+        notionals = equity * (slices.target - slices.current)
+        base_qtys = np.abs(notionals) / safe_price
+        costs = self.slippage.estimate_cost(np.minimum(base_qtys / 1_000_000, 1.0))
+
+        # Sells close the existing long first; any short remainder is whole shares.
+        buy = notionals > 0
+        current_qty = np.maximum(equity * slices.current / safe_price, 0.0)
+        closing_qty = np.minimum(base_qtys, current_qty)
+        short_qty = np.maximum(base_qtys - closing_qty, 0.0)
+        qtys = np.where(buy, base_qtys, closing_qty + np.floor(short_qty + 1e-9))
+        limit_prices = price * np.where(buy, 1 + costs, 1 - costs)
+
+        keep = (np.abs(notionals) >= 1.0) & (buy | (qtys > 1e-6))
+        return [
+            OrderTicket(
+                symbol=slices.symbol[k],
+                qty=float(qtys[k]),
+                side="buy" if buy[k] else "sell",
                 type="limit",
-                limit_price=limit_price,
+                limit_price=float(limit_prices[k]),
             )
-            tickets.append(ticket)
-        return tickets
+            for k in np.flatnonzero(keep)
+        ]
 
     def reconcile_positions(
         self,
@@ -61,14 +62,15 @@ class ExecutionRouter:
         current_weights: pd.Series,
         prices: pd.Series,
         equity: float,
-    ) -> List[OrderSlice]:
-        slices: list[OrderSlice] = []
-        for symbol, target in target_weights.items():
-            price = float(prices.get(symbol, 0.0))
-            if price == 0:
-                continue
-            current = float(current_weights.get(symbol, 0.0))
-            slices.append(
-                OrderSlice(symbol=symbol, target=target, current=current, price=price)
-            )
-        return slices
+    ) -> OrderSlices:
+        symbols = target_weights.index
+        price = prices.reindex(symbols, fill_value=0.0).to_numpy(dtype=np.float64)
+        priced = price != 0
+        return OrderSlices(
+            symbol=symbols.to_numpy()[priced],
+            target=target_weights.to_numpy(dtype=np.float64)[priced],
+            current=current_weights.reindex(symbols, fill_value=0.0).to_numpy(
+                dtype=np.float64
+            )[priced],
+            price=price[priced],
+        )
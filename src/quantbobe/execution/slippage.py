@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import overload
+
+import numpy as np
 
 
 @dataclass
 class SlippageModel:
     spread_bps: float
     impact_k: float
+    _half_spread: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._half_spread = 0.5 * self.spread_bps / 10000.0
+
+    @overload
+    def estimate_cost(self, participation: float) -> float: ...
+
+    @overload
+    def estimate_cost(self, participation: np.ndarray) -> np.ndarray: ...
 
-    def estimate_cost(self, participation: float) -> float:
-        participation = max(participation, 1e-6)
-        half_spread = 0.5 * self.spread_bps / 10000.0
-        impact = self.impact_k * (participation**1.5)
-        return half_spread + impact
+    def estimate_cost(self, participation: float | np.ndarray) -> float | np.ndarray:
+        """Half-spread plus ``impact_k * participation**1.5``; scalars or arrays."""
+        participation = np.maximum(participation, 1e-6)
+        impact = self.impact_k * participation * np.sqrt(participation)
+        return self._half_spread + impact
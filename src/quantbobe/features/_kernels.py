@@ -0,0 +1,170 @@
+"""Compiled array kernels shared by the signal models."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+from .._njit import njit, prange
+
+
+@njit(parallel=True, cache=True)
+def rolling_mean_std(values: np.ndarray, window: int, min_periods: int):
+    """Rolling mean and population standard deviation down each column.
+
+    Mirrors ``DataFrame.rolling(window, min_periods).mean()`` and
+    ``.std(ddof=0)``: NaNs are skipped, windows with fewer than
+    ``min_periods`` observations are NaN, and windows holding a single
+    repeated value have exactly zero deviation. Each column is streamed once
+    with Welford updates as values enter and leave the window.
+    """
+    n_rows, n_cols = values.shape
+    mean_out = np.full((n_rows, n_cols), np.nan)
+    std_out = np.full((n_rows, n_cols), np.nan)
+    for j in prange(n_cols):
+        nobs = 0
+        mean = 0.0
+        ssqdm = 0.0
+        same = 0
+        prev = np.nan
+        for i in range(n_rows):
+            if i >= window:
+                old = values[i - window, j]
+                if old == old:
+                    nobs -= 1
+                    if nobs > 0:
+                        delta = old - mean
+                        mean -= delta / nobs
+                        ssqdm -= delta * (old - mean)
+                    else:
+                        mean = 0.0
+                        ssqdm = 0.0
+            x = values[i, j]
+            if x == x:
+                same = same + 1 if x == prev else 1
+                prev = x
+                nobs += 1
+                delta = x - mean
+                mean += delta / nobs
+                ssqdm += delta * (x - mean)
+            if nobs > 0 and nobs >= min_periods:
+                if same >= nobs:
+                    mean_out[i, j] = prev
+                    std_out[i, j] = 0.0
+                else:
+                    mean_out[i, j] = mean
+                    std_out[i, j] = math.sqrt(ssqdm / nobs) if ssqdm > 0 else 0.0
+    return mean_out, std_out
+
+
+@njit(parallel=True, cache=True)
+def row_rank_pct(values: np.ndarray):
+    """Percentile rank within each row, like ``rank(axis=1, pct=True)``.
+
+    Ties share their average rank, NaNs stay NaN and are excluded from the
+    row count used as the denominator.
+    """
+    n_rows, n_cols = values.shape
+    out = np.full((n_rows, n_cols), np.nan)
+    for i in prange(n_rows):
+        row = values[i]
+        count = 0
+        for j in range(n_cols):
+            if row[j] == row[j]:
+                count += 1
+        if count == 0:
+            continue
+        # argsort places NaNs last, so the first ``count`` entries are valid.
+        order = np.argsort(row)
+        start = 0
+        while start < count:
+            end = start + 1
+            while end < count and row[order[end]] == row[order[start]]:
+                end += 1
+            rank = (start + 1 + end) / 2.0
+            for k in range(start, end):
+                out[i, order[k]] = rank / count
+            start = end
+    return out
+
+
+@njit(cache=True)
+def segment_std(values: np.ndarray, starts: np.ndarray, ends: np.ndarray):
+    """Population standard deviation of ``values[starts[k]:ends[k]]``.
+
+    NaNs are skipped; segments without observations are NaN.
+    """
+    out = np.full(len(starts), np.nan)
+    for k in range(len(starts)):
+        count = 0
+        total = 0.0
+        for i in range(starts[k], ends[k]):
+            if values[i] == values[i]:
+                count += 1
+                total += values[i]
+        if count == 0:
+            continue
+        mean = total / count
+        ssq = 0.0
+        for i in range(starts[k], ends[k]):
+            if values[i] == values[i]:
+                ssq += (values[i] - mean) ** 2
+        out[k] = math.sqrt(ssq / count)
+    return out
+
+
+@njit(cache=True)
+def rolling_mean_corr(values: np.ndarray, window: int, min_periods: int):
+    """Mean pairwise correlation over a rolling window of rows.
+
+    Equivalent to averaging the strict upper triangle of
+    ``DataFrame.rolling(window, min_periods).corr()`` at each row, for
+    panels without missing values; rows containing NaN are skipped. Means
+    and co-moments are updated incrementally as rows enter and leave the
+    window, so each step costs O(N^2) rather than a fresh N x N estimate.
+    Pairs with zero variance are left out of the average.
+    """
+    n_rows, n_cols = values.shape
+    out = np.full(n_rows, np.nan)
+    mean = np.zeros(n_cols)
+    comoment = np.zeros((n_cols, n_cols))
+    delta = np.zeros(n_cols)
+    nobs = 0
+    for t in range(n_rows):
+        if t >= window:
+            old = values[t - window]
+            if not np.isnan(old).any():
+                nobs -= 1
+                if nobs == 0:
+                    mean[:] = 0.0
+                    comoment[:, :] = 0.0
+                else:
+                    for i in range(n_cols):
+                        delta[i] = old[i] - mean[i]
+                        mean[i] -= delta[i] / nobs
+                    for i in range(n_cols):
+                        for j in range(i, n_cols):
+                            comoment[i, j] -= delta[i] * (old[j] - mean[j])
+        row = values[t]
+        if not np.isnan(row).any():
+            nobs += 1
+            for i in range(n_cols):
+                delta[i] = row[i] - mean[i]
+                mean[i] += delta[i] / nobs
+            for i in range(n_cols):
+                for j in range(i, n_cols):
+                    comoment[i, j] += delta[i] * (row[j] - mean[j])
+        if nobs < max(min_periods, 1):
+            continue
+        total = 0.0
+        pairs = 0
+        for i in range(n_cols):
+            for j in range(i + 1, n_cols):
+                denom = math.sqrt(comoment[i, i] * comoment[j, j])
+                if denom > 0:
+                    total += comoment[i, j] / denom
+                    pairs += 1
+        if pairs > 0:
+            out[t] = total / pairs
+    return out
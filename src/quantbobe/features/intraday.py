@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ._kernels import segment_std
+
 
 def compute_vwap(df: pd.DataFrame) -> float:
     volume = df["volume"].sum()
@@ -26,35 +28,48 @@ def vwap_zscores(
     sector_proxies = sector_proxies or {}
     blackout: set[str] = set(earnings_blackout) if earnings_blackout else set()
 
-    intraday = intraday.copy()
-    intraday.index.names = ["timestamp", "symbol"]
-    latest_daily = latest_daily.reset_index()
-    latest_daily = latest_daily.sort_values("date").groupby("symbol").tail(1)
-
-    signals: list[dict[str, float | str]] = []
-    for symbol, group in intraday.groupby(level="symbol"):
-        if symbol in blackout:
-            continue
-        daily = latest_daily[latest_daily["symbol"] == symbol]
-        if daily.empty:
-            continue
-        last_close = float(daily["close"].iloc[-1])
-        dollar_volume = float(daily["close"].iloc[-1] * daily["volume"].iloc[-1])
-        if dollar_volume < min_dollar_vol:
-            continue
-        vwap = compute_vwap(group.reset_index(level="symbol", drop=True))
-        zscore = (last_close - vwap) / max(np.std(group["close"].values[-20:]), 1e-3)
-        sector = sectors.get(symbol, "Unknown")
-        signals.append(
-            {
-                "symbol": symbol,
-                "sector": sector,
-                "zscore": zscore,
-                "signal": float(np.clip(-zscore / z_entry, -1.5, 1.5)),
-            }
-        )
-    if not signals:
+    intraday = intraday.rename_axis(["timestamp", "symbol"])
+    daily = (
+        latest_daily.reset_index()
+        .sort_values("date")
+        .drop_duplicates("symbol", keep="last")
+        .set_index("symbol")
+    )
+
+    # Contiguous per-symbol segments, bars kept in their original row order.
+    codes, uniques = pd.factorize(intraday.index.get_level_values("symbol"), sort=True)
+    symbols = pd.Index(uniques, name="symbol")
+    order = np.argsort(codes, kind="stable")
+    ends = np.cumsum(np.bincount(codes, minlength=len(symbols)))
+    starts = np.concatenate(([0], ends[:-1]))
+    closes = intraday["close"].to_numpy(np.float64)[order]
+    volume = intraday["volume"].to_numpy(np.float64)[order]
+
+    # Missing bars drop out of the sums, as with a skipna groupby sum.
+    pv_sum = np.add.reduceat(np.nan_to_num(closes * volume), starts)
+    volume_sum = np.add.reduceat(np.nan_to_num(volume), starts)
+    last_bar = closes[ends - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        vwap = np.where(volume_sum != 0, pv_sum / volume_sum, last_bar)
+    tail_std = segment_std(closes, np.maximum(ends - 20, starts), ends)
+
+    last = daily[["close", "volume"]].reindex(symbols)
+    last_close = last["close"]
+    dollar_volume = last_close * last["volume"]
+    keep = (
+        ~symbols.isin(list(blackout))
+        & (daily.index.get_indexer(symbols) >= 0)
+        & ~(dollar_volume < min_dollar_vol).to_numpy()
+    )
+    if not keep.any():
         return pd.DataFrame()
-    df = pd.DataFrame(signals)
-    df.set_index("symbol", inplace=True)
-    return df
+    zscore = (last_close - vwap) / np.maximum(tail_std, 1e-3)
+    df = pd.DataFrame(
+        {
+            "sector": symbols.map(lambda symbol: sectors.get(symbol, "Unknown")),
+            "zscore": zscore.to_numpy(),
+            "signal": np.clip(-zscore.to_numpy() / z_entry, -1.5, 1.5),
+        },
+        index=symbols,
+    )
+    return df[keep]
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Optional
 
 import numpy as np
 import pandas as pd
 
+from ._kernels import rolling_mean_std
+
 
 def _extract_prices(data: pd.DataFrame, field: str) -> pd.DataFrame:
     if data.empty:
@@ -28,6 +30,8 @@ class MeanReversionConfig:
     vol_scaling: bool = True
     trend_window: int = 50
     gap_weight: float = 0.5
+    # Input precision for the rolling kernels; they accumulate in float64.
+    dtype: type[np.floating[Any]] = np.float64
 
 
 class MeanReversionSignals:
@@ -36,41 +40,46 @@ class MeanReversionSignals:
     def __init__(self, config: MeanReversionConfig | None = None) -> None:
         self.config = config or MeanReversionConfig()
 
-    def _rolling_stats(
-        self, returns: pd.DataFrame
-    ) -> tuple[pd.DataFrame, pd.DataFrame]:
-        mean = returns.rolling(
-            window=self.config.lookback_window,
-            min_periods=self.config.min_observations,
-        ).mean()
-        std = returns.rolling(
-            window=self.config.lookback_window,
-            min_periods=self.config.min_observations,
-        ).std(ddof=0)
-        return mean, std.replace(0, np.nan)
-
     def compute_z_scores(self, returns: pd.DataFrame) -> pd.DataFrame:
-        mean, std = self._rolling_stats(returns)
-        z = (returns - mean) / std
-        z = z.replace([np.inf, -np.inf], np.nan)
-        return z.fillna(0.0)
+        values = returns.to_numpy(self.config.dtype)
+        mean, std = rolling_mean_std(
+            values, self.config.lookback_window, self.config.min_observations
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (values - mean) / std
+        # Zero or undefined deviation and non-finite ratios carry no signal.
+        z[~np.isfinite(z)] = 0.0
+        return pd.DataFrame(z, index=returns.index, columns=returns.columns)
+
+    def _trend_mask(self, closes: np.ndarray) -> np.ndarray:
+        window = self.config.trend_window
+        sma_short, _ = rolling_mean_std(closes, 10, 10)
+        sma_long, _ = rolling_mean_std(closes, window, window // 2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            spread = np.abs(sma_short - sma_long) / np.where(
+                sma_long != 0, sma_long, np.nan
+            )
+        # NaN spreads (warm-up, zero long SMA) compare False: not range-bound.
+        return spread < 0.02
 
     def filter_trending(self, closes: pd.DataFrame) -> pd.DataFrame:
-        sma_short = closes.rolling(window=10, min_periods=10).mean()
-        sma_long = closes.rolling(
-            window=self.config.trend_window, min_periods=self.config.trend_window // 2
-        ).mean()
-        spread = (sma_short - sma_long) / sma_long.replace(0, np.nan)
-        return (spread.abs() < 0.02).fillna(False)
+        mask = self._trend_mask(closes.to_numpy(self.config.dtype))
+        return pd.DataFrame(mask, index=closes.index, columns=closes.columns)
 
     def compute_overnight_gaps(self, data: pd.DataFrame) -> pd.DataFrame:
         if {"open", "close"}.isdisjoint(data.columns):
             return pd.DataFrame()
         opens = _extract_prices(data, "open")
-        closes = _extract_prices(data, "close")
-        prev_close = closes.shift(1)
-        gaps = (opens - prev_close) / prev_close.replace(0, np.nan)
-        return gaps.replace([np.inf, -np.inf], 0).fillna(0)
+        closes = _extract_prices(data, "close").reindex_like(opens)
+        open_values = opens.to_numpy(np.float64)
+        prev_close = np.empty_like(open_values)
+        prev_close[:1] = np.nan
+        prev_close[1:] = closes.to_numpy(np.float64)[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            gaps = (open_values - prev_close) / prev_close
+        # Missing or zero previous closes and non-finite gaps carry no signal.
+        gaps[~np.isfinite(gaps)] = 0.0
+        return pd.DataFrame(gaps, index=opens.index, columns=opens.columns)
 
     def gap_signals(self, gaps: pd.DataFrame) -> pd.DataFrame:
         if gaps.empty:
@@ -80,12 +89,13 @@ class MeanReversionSignals:
         return capped.fillna(0.0)
 
     def volatility_scale(self, returns: pd.DataFrame) -> pd.DataFrame:
-        vol = returns.rolling(20, min_periods=5).std(ddof=0)
-        inv_vol = 1 / vol.replace(0, np.nan)
-        inv_vol = inv_vol.replace([np.inf, -np.inf], np.nan)
-        norm = inv_vol.sum(axis=1, skipna=True)
-        scale = inv_vol.div(norm, axis=0)
-        return scale.fillna(0.0)
+        _, vol = rolling_mean_std(returns.to_numpy(self.config.dtype), 20, 5)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_vol = 1.0 / vol
+            inv_vol[~np.isfinite(inv_vol)] = np.nan
+            scale = inv_vol / np.nansum(inv_vol, axis=1, keepdims=True)
+        scale[np.isnan(scale)] = 0.0
+        return pd.DataFrame(scale, index=returns.index, columns=returns.columns)
 
     def generate_signals(
         self,
@@ -99,10 +109,14 @@ class MeanReversionSignals:
         if closes.empty:
             return closes
         returns = closes.pct_change(fill_method=None).fillna(0)
-        price_filter = self.filter_trending(closes)
-        z_scores = self.compute_z_scores(returns)
-        extremes = (z_scores.abs() >= self.config.z_score_threshold)
-        signals = -z_scores.where(extremes & price_filter, 0.0)
+        price_filter = self._trend_mask(closes.to_numpy(self.config.dtype))
+        z_scores = self.compute_z_scores(returns).to_numpy()
+        extremes = np.abs(z_scores) >= self.config.z_score_threshold
+        signals = pd.DataFrame(
+            -np.where(extremes & price_filter, z_scores, 0.0),
+            index=closes.index,
+            columns=closes.columns,
+        )
         if self.config.gap_weight > 0:
             gaps = self.compute_overnight_gaps(data)
             gap_signal = self.gap_signals(gaps)
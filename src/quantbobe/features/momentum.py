@@ -4,16 +4,6 @@ import numpy as np
 import pandas as pd
 
 
-def _compute_return(
-    prices: pd.Series, lookback: int, skip_months: int = 1
-) -> pd.Series:
-    offset = skip_months * 21
-    lag = lookback * 21 + offset
-    shifted = prices.shift(lag)
-    reference = prices.shift(offset)
-    return (reference / shifted) - 1.0
-
-
 def cross_sectional_momentum(
     prices: pd.DataFrame,
     sectors: dict[str, str],
@@ -23,32 +13,29 @@ def cross_sectional_momentum(
     """Compute 12-1M momentum ranks by sector."""
     if prices.empty:
         return pd.DataFrame()
-    skip = 1 if skip_recent_month else 0
-    momentum = prices.groupby(level="symbol")[["adj_close"]].apply(
-        lambda df: _compute_return(df["adj_close"], lookback_months, skip)
-    )
-    momentum = momentum.reset_index(level=0, drop=True).to_frame("momentum")
-    momentum = momentum.dropna()
+    offset = (1 if skip_recent_month else 0) * 21
+    lag = lookback_months * 21 + offset
+    # Grouped shifts run in one vectorised pass over all symbols, each lagging
+    # its own rows exactly as a per-symbol shift would.
+    by_symbol = prices["adj_close"].groupby(level="symbol", sort=False)
+    momentum = (by_symbol.shift(offset) / by_symbol.shift(lag) - 1.0).dropna()
     if momentum.empty:
         return pd.DataFrame()
-    df = (
-        momentum.reset_index().rename(columns={"level_0": "date"})
-        if "level_0" in momentum.index.names
-        else momentum.reset_index()
+    dates = momentum.index.get_level_values(0)
+    symbols = momentum.index.get_level_values("symbol")
+    sector = pd.Series(symbols.map(sectors), index=momentum.index, dtype=object)
+    # Percentile rank within each (date, sector) block; unmapped sectors stay NaN.
+    rank = momentum.groupby([dates, sector.to_numpy()]).rank(pct=True)
+    rank_values = rank.to_numpy()
+    combined = pd.DataFrame(
+        {
+            "signal": np.where(
+                rank_values >= 0.8, 1.0, np.where(rank_values <= 0.2, -1.0, 0.0)
+            ),
+            "weight_hint": rank_values - 0.5,
+            "momentum": momentum.to_numpy(),
+            "sector": sector.to_numpy(),
+        },
+        index=pd.MultiIndex.from_arrays([dates, symbols], names=["date", "symbol"]),
     )
-    df.columns = ["date", "symbol", "momentum"]
-    df["sector"] = df["symbol"].map(sectors)
-    results: list[pd.DataFrame] = []
-    for _date, group in df.groupby("date"):
-        ranked = group.copy()
-        ranked["rank"] = ranked.groupby("sector")["momentum"].transform(
-            lambda x: x.rank(pct=True)
-        )
-        ranked["signal"] = np.where(
-            ranked["rank"] >= 0.8, 1.0, np.where(ranked["rank"] <= 0.2, -1.0, 0.0)
-        )
-        ranked["weight_hint"] = ranked["rank"] - 0.5
-        results.append(ranked)
-    combined = pd.concat(results, ignore_index=True)
-    combined.set_index(["date", "symbol"], inplace=True)
-    return combined[["signal", "weight_hint", "momentum", "sector"]]
+    return combined.sort_index()
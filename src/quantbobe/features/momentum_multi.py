@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 
+from ._kernels import rolling_mean_std, row_rank_pct
+
 
 def _ensure_wide(prices: pd.DataFrame) -> pd.DataFrame:
     if prices.empty:
@@ -21,11 +23,41 @@ def _ensure_wide(prices: pd.DataFrame) -> pd.DataFrame:
     return prices
 
 
+def _sector_positions(
+    columns: pd.Index, sectors: Dict[str, str]
+) -> Dict[str, np.ndarray]:
+    """Invert ``sectors`` into positional indices of ``columns`` per sector."""
+    by_sector: Dict[str, List[str]] = {}
+    for symbol, sector in sectors.items():
+        by_sector.setdefault(sector or "Unknown", []).append(symbol)
+    if not by_sector:
+        return {"Universe": np.arange(len(columns))}
+    positions = {}
+    for sector, members in by_sector.items():
+        idx = columns.get_indexer(members)
+        positions[sector] = idx[idx >= 0]
+    return positions
+
+
+def _top_n(values: np.ndarray, n: int) -> np.ndarray:
+    """Positions of the ``n`` largest values, ties resolved like ``nlargest``."""
+    if n >= len(values):
+        return np.arange(len(values))
+    kth = np.partition(values, len(values) - n)[len(values) - n]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[: n - len(above)]
+    return np.concatenate([above, ties])
+
+
 @dataclass
 class MomentumConfig:
     timeframes: List[Tuple[int, float]]
     skip_recent_month: bool = True
     min_history_months: int = 15
+    # Input precision for the rank and volatility kernels, which accumulate in
+    # float64. float32 halves memory traffic but can merge near-equal scores
+    # into rank ties.
+    dtype: type[np.floating[Any]] = np.float64
 
 
 class MultiTimeframeMomentum:
@@ -68,8 +100,14 @@ class MultiTimeframeMomentum:
         wide = _ensure_wide(prices)
         if wide.empty:
             return wide
-        returns = wide.pct_change(fill_method=None)
-        combined = pd.DataFrame(0.0, index=wide.index, columns=wide.columns)
+        return self._combined_momentum(
+            wide, wide.pct_change(fill_method=None), use_quality_filter
+        )
+
+    def _combined_momentum(
+        self, wide: pd.DataFrame, returns: pd.DataFrame, use_quality_filter: bool
+    ) -> pd.DataFrame:
+        combined = np.zeros(wide.shape)
         for lookback, weight in self.config.timeframes:
             mom = self.compute_single_momentum(
                 wide, lookback, self.config.skip_recent_month
@@ -77,10 +115,13 @@ class MultiTimeframeMomentum:
             if use_quality_filter:
                 quality = self.compute_momentum_quality(returns, lookback * 21)
                 mom = mom * quality
-            ranked = mom.rank(axis=1, pct=True, method="average")
-            combined = combined.add(ranked.fillna(0) * weight, fill_value=0)
-        combined = combined.rank(axis=1, pct=True, method="average")
-        return combined.fillna(0)
+            ranked = row_rank_pct(mom.to_numpy(dtype=self.config.dtype))
+            combined += np.nan_to_num(ranked, nan=0.0) * weight
+        return pd.DataFrame(
+            np.nan_to_num(row_rank_pct(combined), nan=0.0),
+            index=wide.index,
+            columns=wide.columns,
+        )
 
     def compute_momentum_crash_scale(
         self,
@@ -90,52 +131,41 @@ class MultiTimeframeMomentum:
     ) -> pd.Series:
         if returns.empty:
             return pd.Series(dtype=float)
-        vol = returns.rolling(
-            window=vol_window,
-            min_periods=vol_window // 2,
-        ).std(ddof=0)
-        realized = vol.mean(axis=1)
-        long_ma = realized.rolling(
-            window=long_window,
-            min_periods=long_window // 4,
-        ).mean()
-        long_std = realized.rolling(
-            window=long_window,
-            min_periods=long_window // 4,
-        ).std(ddof=0)
-        z = (realized - long_ma) / long_std.replace(0, np.nan)
-        z = z.clip(lower=-3, upper=3).fillna(0)
-        scale = 1.0 - (z.clip(lower=0) / 3.0) * 0.5
-        return scale.clip(lower=0.4, upper=1.0)
+        _, vol = rolling_mean_std(
+            returns.to_numpy(self.config.dtype), vol_window, vol_window // 2
+        )
+        observed = ~np.isnan(vol)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            realized = np.where(observed, vol, 0.0).sum(axis=1) / observed.sum(axis=1)
+            long_ma, long_std = rolling_mean_std(
+                realized[:, None], long_window, long_window // 4
+            )
+            z = (realized - long_ma[:, 0]) / long_std[:, 0]
+        z[~np.isfinite(z)] = 0.0
+        z = np.clip(z, -3, 3)
+        scale = 1.0 - (np.maximum(z, 0.0) / 3.0) * 0.5
+        return pd.Series(np.clip(scale, 0.4, 1.0), index=returns.index)
 
     def _sector_neutral_long_short(
         self,
-        ranks: pd.Series,
-        sectors: Dict[str, str],
+        row: np.ndarray,
+        by_sector: Dict[str, np.ndarray],
         top_quantile: float,
         bottom_quantile: float,
-    ) -> pd.Series:
-        weights = pd.Series(0.0, index=ranks.index)
-        by_sector: Dict[str, List[str]] = {}
-        for symbol, sector in sectors.items():
-            by_sector.setdefault(sector or "Unknown", []).append(symbol)
-        if not by_sector:
-            by_sector = {"Universe": ranks.index.tolist()}
+    ) -> np.ndarray:
+        weights = np.zeros(len(row))
         sector_count = max(len(by_sector), 1)
-        sectors_iter = by_sector.items()
-        for _sector, members in sectors_iter:
-            symbols = ranks.reindex(members).dropna()
-            if symbols.empty:
+        for members in by_sector.values():
+            vals = row[members]
+            mask = ~np.isnan(vals)
+            if not mask.any():
                 continue
-            n = len(symbols)
+            members, vals = members[mask], vals[mask]
+            n = len(vals)
             n_long = max(1, int(n * top_quantile))
             n_short = max(1, int(n * bottom_quantile))
-            longs = symbols.nlargest(n_long)
-            shorts = symbols.nsmallest(n_short)
-            long_weight = 1.0 / (sector_count * n_long)
-            short_weight = -1.0 / (sector_count * n_short)
-            weights.loc[longs.index] = long_weight
-            weights.loc[shorts.index] = short_weight
+            weights[members[_top_n(vals, n_long)]] = 1.0 / (sector_count * n_long)
+            weights[members[_top_n(-vals, n_short)]] = -1.0 / (sector_count * n_short)
         return weights
 
     def generate_long_short_portfolio(
@@ -151,28 +181,32 @@ class MultiTimeframeMomentum:
         wide = _ensure_wide(prices)
         if wide.empty:
             return pd.DataFrame(columns=wide.columns)
+        returns = wide.pct_change(fill_method=None)
         combined = (
             scores.reindex(columns=wide.columns)
             if scores is not None
-            else self.compute_combined_momentum(wide, use_quality_filter=True)
+            else self._combined_momentum(wide, returns, use_quality_filter=True)
         )
-        returns = wide.pct_change(fill_method=None).fillna(0)
-        crash_scale = self.compute_momentum_crash_scale(returns)
+        crash_scale = self.compute_momentum_crash_scale(returns.fillna(0))
         freq = "ME" if rebal_freq == "M" else rebal_freq
-        grouped = combined.groupby(pd.Grouper(freq=freq))
+        by_sector = _sector_positions(combined.columns, sectors)
+        # Last available date in each rebalance period.
+        rebal_dates = combined.index.to_series().resample(freq).max().dropna()
         weights: list[pd.Series] = []
-        for _, frame in grouped:
-            if frame.empty:
-                continue
-            date = frame.index.max()
-            if date not in combined.index:
-                continue
-            ranks = combined.loc[date].dropna()
+        for date in rebal_dates:
+            row = combined.loc[date]
+            ranks = row.dropna()
             if ranks.empty:
                 continue
             if sector_neutral:
-                weight = self._sector_neutral_long_short(
-                    ranks, sectors, top_quantile, bottom_quantile
+                weight = pd.Series(
+                    self._sector_neutral_long_short(
+                        row.to_numpy(dtype=float),
+                        by_sector,
+                        top_quantile,
+                        bottom_quantile,
+                    ),
+                    index=combined.columns,
                 )
             else:
                 n = len(ranks)
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from typing import TypeVar
+
 import numpy as np
 import pandas as pd
 
+_PandasT = TypeVar("_PandasT", pd.Series, pd.DataFrame)
+
 QUALITY_FIELDS = {
     "ROA": "return_on_assets",
     "GrossMargin": "gross_margin",
@@ -11,27 +15,61 @@ QUALITY_FIELDS = {
 }
 
 
-def _zscore(series: pd.Series) -> pd.Series:
-    if series.std(ddof=0) == 0 or series.isna().all():
-        return pd.Series(0.0, index=series.index)
-    return (series - series.mean()) / series.std(ddof=0)
+# Alternative spellings of statement line items, mapped to the canonical name.
+_ALIASES = {
+    "NetIncome": "Net Income",
+    "TotalAssets": "Total Assets",
+    "GrossProfit": "Gross Profit",
+    "TotalRevenue": "Total Revenue",
+    "OperatingCashFlow": "Operating Cash Flow",
+    "StockholdersEquity": "Shareholders Equity",
+}
+
+
+def _canonical_columns(fundamentals: pd.DataFrame) -> pd.DataFrame:
+    """Select the statement lines the scores use, under their canonical names.
+
+    Alias columns are renamed; the canonical column wins when both exist.
+    """
+    redundant = [
+        alias
+        for alias, name in _ALIASES.items()
+        if alias in fundamentals.columns and name in fundamentals.columns
+    ]
+    renamed = fundamentals.drop(columns=redundant).rename(columns=_ALIASES)
+    used = renamed.columns.intersection(list(_ALIASES.values()), sort=False)
+    return renamed[used]
+
+
+def _zscore(values: _PandasT) -> _PandasT:
+    """Z-score each symbol over time; flat or all-NaN symbols score zero.
+
+    Frames are standardised column by column in a single grouped pass.
+    """
+    grouped = values.groupby(level="symbol", sort=False)
+    std = grouped.transform("std", ddof=0)
+    z = (values - grouped.transform("mean")) / std
+    empty = grouped.transform("count") == 0
+    return z.mask((std == 0) | empty, 0.0)
+
+
+def _ratio(num: pd.Series, den: pd.Series) -> pd.Series:
+    return (num / den).replace({np.inf: np.nan})
 
 
 def _quality_lite(fundamentals: pd.DataFrame) -> pd.Series:
-    gross = fundamentals.get("Gross Profit", fundamentals.get("GrossProfit"))
-    assets = fundamentals.get("Total Assets", fundamentals.get("TotalAssets"))
-    accruals = fundamentals.get(
-        "Operating Cash Flow", fundamentals.get("OperatingCashFlow")
-    )
-    eps = fundamentals.get("Net Income", fundamentals.get("NetIncome"))
+    gross = fundamentals.get("Gross Profit")
+    assets = fundamentals.get("Total Assets")
+    accruals = fundamentals.get("Operating Cash Flow")
+    eps = fundamentals.get("Net Income")
     out = pd.Series(0.0, index=fundamentals.index)
     if gross is not None and assets is not None:
-        out = out + _zscore((gross / assets).replace({np.inf: np.nan}))
+        out = out + _zscore(_ratio(gross, assets))
     if accruals is not None and assets is not None:
         accrual_ratio = 1 - (accruals / assets)
         out = out + _zscore(accrual_ratio.replace({np.inf: np.nan}).fillna(0))
     if eps is not None and assets is not None:
-        out = out + _zscore((eps / assets).replace({np.inf: np.nan}).fillna(0))
+        out = out + _zscore(_ratio(eps, assets).fillna(0))
     return out
 
 
@@ -44,7 +82,7 @@ def compute_quality_value(
     if fundamentals.empty:
         return pd.DataFrame()
     fields = fields or list(QUALITY_FIELDS.keys())
-    fundamentals = fundamentals.copy()
+    fundamentals = _canonical_columns(fundamentals)
     fundamentals.index = fundamentals.index.set_levels(
         [
             (
@@ -58,61 +96,35 @@ def compute_quality_value(
     fundamentals = fundamentals.sort_index()
     fundamentals = fundamentals.groupby(level="symbol").shift(lookahead_guard_days)
 
-    scores: list[pd.DataFrame] = []
-    for symbol, group in fundamentals.groupby(level="symbol"):
-        frame = group.copy()
-        partials = []
-        for field in fields:
-            if field == "ROA":
-                roa = frame.get(
-                    "Net Income", frame.get("NetIncome", pd.Series(index=frame.index))
-                )
-                assets = frame.get(
-                    "Total Assets",
-                    frame.get("TotalAssets", pd.Series(index=frame.index)),
-                )
-                val = (roa / assets).replace({np.inf: np.nan})
-                partials.append(_zscore(val.fillna(0)))
-            elif field == "GrossMargin":
-                gross = frame.get(
-                    "Gross Profit",
-                    frame.get("GrossProfit", pd.Series(index=frame.index)),
-                )
-                revenue = frame.get(
-                    "Total Revenue",
-                    frame.get("TotalRevenue", pd.Series(index=frame.index)),
-                )
-                val = (gross / revenue).replace({np.inf: np.nan})
-                partials.append(_zscore(val.fillna(0)))
-            elif field == "Accruals":
-                net_income = frame.get(
-                    "Net Income", frame.get("NetIncome", pd.Series(index=frame.index))
-                )
-                cash_flow = frame.get(
-                    "Operating Cash Flow",
-                    frame.get("OperatingCashFlow", pd.Series(index=frame.index)),
-                )
-                val = (net_income - cash_flow).replace({np.inf: np.nan})
-                partials.append(-_zscore(val.fillna(0)))
-            elif field == "EP":
-                earnings = frame.get(
-                    "Net Income", frame.get("NetIncome", pd.Series(index=frame.index))
-                )
-                equity = frame.get(
-                    "Shareholders Equity",
-                    frame.get("StockholdersEquity", pd.Series(index=frame.index)),
-                )
-                val = (earnings / equity).replace({np.inf: np.nan})
-                partials.append(_zscore(val.fillna(0)))
-        if not partials:
-            score = _quality_lite(frame)
+    missing = pd.Series(np.nan, index=fundamentals.index)
+
+    def column(name: str) -> pd.Series:
+        return fundamentals.get(name, missing)
+
+    # Raw factor values, z-scored together below; accruals score inversely.
+    values: list[pd.Series] = []
+    signs: list[float] = []
+    for field in fields:
+        if field == "ROA":
+            val = _ratio(column("Net Income"), column("Total Assets"))
+        elif field == "GrossMargin":
+            val = _ratio(column("Gross Profit"), column("Total Revenue"))
+        elif field == "Accruals":
+            val = column("Net Income") - column("Operating Cash Flow")
+            val = val.replace({np.inf: np.nan})
+        elif field == "EP":
+            val = _ratio(column("Net Income"), column("Shareholders Equity"))
         else:
-            score = sum(partials) / max(len(partials), 1)
-        df = score.to_frame(name="qv_score")
-        df["symbol"] = symbol
-        scores.append(df)
-    if not scores:
-        return pd.DataFrame()
-    combined = pd.concat(scores)
+            continue
+        values.append(val.fillna(0))
+        signs.append(-1.0 if field == "Accruals" else 1.0)
+    if not values:
+        score = _quality_lite(fundamentals)
+    else:
+        z = _zscore(pd.concat(values, axis=1, keys=range(len(values)))) * signs
+        score = z.sum(axis=1, skipna=False) / len(values)
+
+    combined = score.to_frame(name="qv_score")
+    combined["symbol"] = combined.index.get_level_values("symbol")
     combined.index.names = ["date", "symbol"]
-    return combined.sort_index()
+    return combined
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import hashlib
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Dict
 
 import numpy as np
 import pandas as pd
 
+from ._kernels import rolling_mean_corr, rolling_mean_std
+
 
 @dataclass
 class RegimeState:
@@ -37,7 +41,10 @@ def _select_price_field(prices: pd.DataFrame) -> pd.DataFrame:
 
 
 def trend_breadth(prices: pd.DataFrame, window: int = 200) -> pd.Series:
-    closes = _select_price_field(prices)
+    return _trend_breadth(_select_price_field(prices), window)
+
+
+def _trend_breadth(closes: pd.DataFrame, window: int) -> pd.Series:
     ma = closes.rolling(window=window).mean()
     breadth = (closes > ma).sum(axis=1) / closes.count(axis=1)
     return breadth
@@ -62,18 +69,44 @@ def regime_weights(
     base_allocations: Dict[str, Dict[str, float]],
     neutral_weights: Dict[str, float],
 ) -> dict[pd.Timestamp, dict[str, float]]:
-    weights: dict[pd.Timestamp, dict[str, float]] = {}
-    risk_off_cut = thresholds["risk_off"]
-    risk_on_cut = thresholds["risk_on"]
-    for ts, value in breadth.items():
-        if value <= risk_off_cut:
-            weights[ts] = base_allocations.get("risk_off", neutral_weights)
-        elif value >= risk_on_cut:
-            weights[ts] = base_allocations.get("risk_on", neutral_weights)
-        else:
-            # Interpolate to neutral weights when in the middle
-            weights[ts] = neutral_weights
-    return weights
+    values = breadth.to_numpy(np.float64)
+    # Index into (risk_off, risk_on, neutral); NaN breadth stays neutral.
+    choice = np.select(
+        [values <= thresholds["risk_off"], values >= thresholds["risk_on"]],
+        [0, 1],
+        default=2,
+    )
+    states = (
+        base_allocations.get("risk_off", neutral_weights),
+        base_allocations.get("risk_on", neutral_weights),
+        neutral_weights,
+    )
+    return dict(zip(breadth.index, [states[i] for i in choice], strict=True))
+
+
+def _mean_rolling_std(
+    returns: pd.DataFrame, window: int, min_periods: int
+) -> pd.Series:
+    """Cross-sectional mean of each column's rolling population std."""
+    _, std = rolling_mean_std(returns.to_numpy(np.float64), window, min_periods)
+    count = np.count_nonzero(~np.isnan(std), axis=1)
+    with np.errstate(invalid="ignore"):
+        mean = np.nansum(std, axis=1) / count
+    return pd.Series(mean, index=returns.index)
+
+
+def _frame_digest(frame: pd.DataFrame) -> str:
+    """Content hash of a wide price frame's dates and values."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pd.util.hash_pandas_object(frame.index).to_numpy().tobytes())
+    digest.update(np.ascontiguousarray(frame.to_numpy(np.float64)).tobytes())
+    return digest.hexdigest()
+
+
+# Live polling re-evaluates the same daily history until a new bar lands, so
+# recent results are kept per (windows, symbols, content digest).
+_EVALUATE_CACHE_SIZE = 8
+_evaluate_cache: OrderedDict[tuple[object, ...], pd.DataFrame] = OrderedDict()
 
 
 @dataclass
@@ -102,32 +135,22 @@ class RegimeDetector:
         return _select_price_field(prices)
 
     def _realized_vol(self, returns: pd.DataFrame) -> pd.Series:
-        vol = returns.rolling(
-            window=self.vol_window,
-            min_periods=self.vol_window // 2,
-        ).std(ddof=0)
-        return vol.mean(axis=1).ffill()
+        vol = _mean_rolling_std(returns, self.vol_window, self.vol_window // 2)
+        return vol.ffill()
 
     def _corr_score(self, returns: pd.DataFrame) -> pd.Series:
         if returns.shape[1] < 2:
             return pd.Series(0.0, index=returns.index)
-        rolling = returns.rolling(
-            window=self.corr_window,
-            min_periods=self.corr_window // 2,
-        )
-        correlations = rolling.corr().groupby(level=0).apply(
-            lambda mat: mat.where(
-                np.triu(np.ones(mat.shape), k=1).astype(bool)
-            ).stack().mean()
+        correlations = rolling_mean_corr(
+            returns.to_numpy(np.float64),
+            self.corr_window,
+            self.corr_window // 2,
         )
-        return correlations.ffill().fillna(0.0)
+        return pd.Series(correlations, index=returns.index).ffill().fillna(0.0)
 
     def _dispersion(self, returns: pd.DataFrame) -> pd.Series:
-        dispersion = returns.rolling(
-            window=self.dispersion_window,
-            min_periods=5,
-        ).std(ddof=0)
-        return dispersion.mean(axis=1).ffill().fillna(0.0)
+        dispersion = _mean_rolling_std(returns, self.dispersion_window, 5)
+        return dispersion.ffill().fillna(0.0)
 
     def evaluate(self, prices: pd.DataFrame) -> pd.DataFrame:
         wide = self._wide_prices(prices)
@@ -135,8 +158,27 @@ class RegimeDetector:
             return pd.DataFrame(
                 columns=["label", "momentum_scale", "mean_reversion_scale"]
             )
+        key = (
+            self.breadth_window,
+            self.vol_window,
+            self.corr_window,
+            self.dispersion_window,
+            tuple(wide.columns),
+            _frame_digest(wide),
+        )
+        frame = _evaluate_cache.get(key)
+        if frame is None:
+            frame = self._evaluate(wide)
+            _evaluate_cache[key] = frame
+            if len(_evaluate_cache) > _EVALUATE_CACHE_SIZE:
+                _evaluate_cache.popitem(last=False)
+        else:
+            _evaluate_cache.move_to_end(key)
+        return frame.copy(deep=False)
+
+    def _evaluate(self, wide: pd.DataFrame) -> pd.DataFrame:
         returns = wide.pct_change(fill_method=None).dropna()
-        breadth = trend_breadth(prices, window=self.breadth_window)
+        breadth = _trend_breadth(wide, self.breadth_window)
         breadth = breadth.reindex(returns.index).ffill()
         realized_vol = self._realized_vol(returns)
         corr = self._corr_score(returns)
@@ -177,33 +219,40 @@ class RegimeDetector:
             + 0.10 * disp_score.fillna(0.3)
         )
 
-        records: list[tuple[pd.Timestamp, RegimeOutcome]] = []
-        for date, score in risk_level.items():
-            breadth_val = float(breadth_score.get(date, 0.5))
-            vol_val = float(vol_score.get(date, 0.5))
-            corr_val = float(corr_score.get(date, 0.3))
-            if score >= 0.7:
-                outcome = RegimeOutcome("risk_off", 0.6, 0.3)
-            elif vol_val >= 0.7 and breadth_val <= 0.5:
-                outcome = RegimeOutcome("volatile", 0.6, 0.4)
-            elif score <= 0.4 and breadth_val >= 0.55:
-                outcome = RegimeOutcome("risk_on", 1.0, 1.0)
-            else:
-                mean_rev = 0.7 if corr_val < 0.6 else 0.5
-                outcome = RegimeOutcome("transition", 0.85, mean_rev)
-            records.append((date, outcome))
-
-        index = [ts for ts, _ in records]
+        score = risk_level.to_numpy()
+        breadth_val = breadth_score.to_numpy()
+        vol_val = vol_score.to_numpy()
+        corr_val = corr_score.to_numpy()
+        # np.select takes the first matching state, so the order is the
+        # precedence; everything else is a transition.
+        conditions = [
+            score >= 0.7,
+            (vol_val >= 0.7) & (breadth_val <= 0.5),
+            (score <= 0.4) & (breadth_val >= 0.55),
+        ]
+        outcomes = [
+            RegimeOutcome("risk_off", 0.6, 0.3),
+            RegimeOutcome("volatile", 0.6, 0.4),
+            RegimeOutcome("risk_on", 1.0, 1.0),
+        ]
         df = pd.DataFrame(
             {
-                "label": [outcome.label for _, outcome in records],
-                "momentum_scale": [
-                    outcome.momentum_scale for _, outcome in records
-                ],
-                "mean_reversion_scale": [
-                    outcome.mean_reversion_scale for _, outcome in records
-                ],
+                "label": np.select(
+                    conditions,
+                    [outcome.label for outcome in outcomes],
+                    default="transition",
+                ),
+                "momentum_scale": np.select(
+                    conditions,
+                    [outcome.momentum_scale for outcome in outcomes],
+                    default=0.85,
+                ),
+                "mean_reversion_scale": np.select(
+                    conditions,
+                    [outcome.mean_reversion_scale for outcome in outcomes],
+                    default=np.where(corr_val < 0.6, 0.7, 0.5),
+                ),
             },
-            index=index,
+            index=risk_level.index,
         )
         return df.sort_index()
@@ -3,11 +3,16 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ._kernels import rolling_mean_std
+
 TRADING_DAYS = 252
 
 
 def realized_vol(returns: pd.DataFrame, window: int = 20) -> pd.Series:
-    return returns.rolling(window).std(ddof=0) * np.sqrt(TRADING_DAYS)
+    _, std = rolling_mean_std(returns.to_numpy(np.float64), window, window)
+    return pd.DataFrame(
+        std * np.sqrt(TRADING_DAYS), index=returns.index, columns=returns.columns
+    )
 
 
 def scale_to_target(
@@ -24,9 +24,9 @@ def _latest_history(provider, symbols, days: int = 252):
     return provider.get_daily_bars(symbols, start, end)
 
 
-def _current_prices(history: pd.DataFrame) -> pd.Series:
-    closes = history["close"].unstack("symbol")
-    return closes.iloc[-1]
+def _current_prices(ctx: StrategyContext) -> pd.Series:
+    # Reuses the context's cached unstack rather than pivoting history again.
+    return ctx.wide("close").iloc[-1]
 
 
 def _positions_to_weights(
@@ -58,6 +58,11 @@ def run_live(config_path: str) -> None:
                 company_headlines=settings.live.news_company_headlines,
                 general_headlines=settings.live.news_general_headlines,
                 refresh_minutes=settings.live.news_refresh_minutes,
+                cache_dir=(
+                    Path(settings.data.path) / "cache" / "news"
+                    if settings.live.news_cache
+                    else None
+                ),
             )
         except Exception as exc:  # pragma: no cover - defensive guard
             logger.warning("Failed to initialise NewsFetcher: %s", exc)
@@ -92,7 +97,7 @@ def run_live(config_path: str) -> None:
         sleeve_weights = compute_sleeve_weights(ctx)
         target = aggregate_target_weights(ctx, sleeve_weights)
         latest_target = target.iloc[-1].copy()
-        prices = _current_prices(history)
+        prices = _current_prices(ctx)
         account_overview = broker.get_account_overview()
         cash_value = account_overview.get("cash")
         fallback_cash = getattr(settings.live, "paper_start_cash", 0.0)
@@ -160,10 +165,11 @@ def run_live(config_path: str) -> None:
                 )
 
         slices = router.reconcile_positions(
-            latest_target, current_weights, prices, equity
+            latest_target.drop(list(risk_symbols), errors="ignore"),
+            current_weights,
+            prices,
+            equity,
         )
-        if risk_symbols:
-            slices = [slc for slc in slices if slc.symbol not in risk_symbols]
         tickets = risk_orders + router.build_orders(slices, equity)
         if tickets:
             broker.submit_orders(tickets)
@@ -209,12 +215,10 @@ def run_live(config_path: str) -> None:
             "equity": equity,
             "cash": cash,
         }
-        if pnl_file.exists():
-            existing = pd.read_csv(pnl_file)
-            existing = pd.concat([existing, pd.DataFrame([pnl_row])], ignore_index=True)
-            existing.to_csv(pnl_file, index=False)
-        else:
-            pd.DataFrame([pnl_row]).to_csv(pnl_file, index=False)
+        new_file = not pnl_file.exists() or pnl_file.stat().st_size == 0
+        pd.DataFrame([pnl_row]).to_csv(
+            pnl_file, mode="a", header=new_file, index=False
+        )
         time.sleep(settings.live.poll_interval_sec)
 
 
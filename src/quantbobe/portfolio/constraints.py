@@ -6,8 +6,7 @@ import pandas as pd
 def enforce_sector_neutrality(weights: pd.Series, sectors: dict[str, str]) -> pd.Series:
     df = pd.DataFrame({"weight": weights})
     df["sector"] = df.index.map(sectors)
-    adj = df.groupby("sector")["weight"].transform(lambda x: x - x.mean())
-    return adj
+    return df["weight"] - df.groupby("sector")["weight"].transform("mean")
 
 
 def clamp_beta(
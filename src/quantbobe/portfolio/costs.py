@@ -74,27 +74,35 @@ class TransactionCostModel:
         max_threshold_bps: float = 50.0,
         portfolio_value: float = 1_000_000.0,
     ) -> pd.Series:
-        adjusted = target_weights.copy()
         min_threshold = min_threshold_bps / 10000.0
         max_threshold = max_threshold_bps / 10000.0
         weight_changes = (target_weights - current_weights).fillna(0.0)
-        for symbol, change in weight_changes.items():
-            abs_change = abs(change)
-            if abs_change < min_threshold:
-                adjusted[symbol] = current_weights.get(symbol, 0.0)
-                continue
-            if abs_change > max_threshold:
-                continue
-            adv_value = adv.get(symbol, np.nan)
-            if pd.isna(adv_value) or adv_value <= 0:
-                continue
-            costs = self.estimate_costs(
-                pd.Series({symbol: target_weights.get(symbol, 0.0)}),
-                pd.Series({symbol: current_weights.get(symbol, 0.0)}),
-                pd.Series({symbol: adv_value}),
-                portfolio_value=portfolio_value,
-            )
-            expected_benefit = abs_change * portfolio_value * 0.01
-            if costs["total_cost"] > expected_benefit:
-                adjusted[symbol] = current_weights.get(symbol, 0.0)
+        symbols = weight_changes.index
+        current = current_weights.reindex(symbols, fill_value=0.0)
+        abs_change = weight_changes.abs().to_numpy(np.float64)
+        adv_values = adv.reindex(symbols).to_numpy(np.float64)
+
+        # Per-symbol version of estimate_costs; every term is linear in the
+        # symbol's own trade, so the names can be priced in one pass.
+        dollar_trades = abs_change * portfolio_value
+        with np.errstate(divide="ignore", invalid="ignore"):
+            participation = np.minimum(dollar_trades / adv_values, 1.0)
+        impact_bps = self.market_impact_coef * np.sqrt(participation)
+        total_cost = (
+            dollar_trades * (self.commission_bps / 10000.0)
+            + dollar_trades * (self.spread_bps / 2 / 10000.0)
+            + dollar_trades * impact_bps / 10000.0
+            + dollar_trades * (self.timing_slippage_bps / 10000.0)
+        )
+        expected_benefit = abs_change * portfolio_value * 0.01
+
+        too_costly = (
+            (abs_change <= max_threshold)
+            & (adv_values > 0)
+            & (total_cost > expected_benefit)
+        )
+        keep_current = (abs_change < min_threshold) | too_costly
+        held = symbols[keep_current]
+        adjusted = target_weights.reindex(target_weights.index.union(held, sort=False))
+        adjusted[held] = current[keep_current].to_numpy()
         return adjusted.fillna(0.0)
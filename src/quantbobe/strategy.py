@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, Iterable
 
@@ -27,6 +27,21 @@ class StrategyContext:
     meta: list[SymbolMeta]
     daily: pd.DataFrame
     fundamentals: pd.DataFrame
+    _wide: Dict[str, pd.DataFrame] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def wide(self, column: str) -> pd.DataFrame:
+        """Return ``daily[column]`` as a date x symbol frame, unstacked once."""
+        frame = self._wide.get(column)
+        if frame is None:
+            frame = self.daily[column].unstack("symbol")
+            self._wide[column] = frame
+        return frame
+
+    def adjusted_closes(self) -> pd.DataFrame:
+        column = "adj_close" if "adj_close" in self.daily.columns else "close"
+        return self.wide(column)
 
 
 def build_context(config_path: str) -> StrategyContext:
@@ -60,11 +75,7 @@ def compute_sleeve_weights(ctx: StrategyContext) -> Dict[str, pd.DataFrame]:
     data = ctx.daily.copy()
     settings = ctx.settings
     sectors = _sector_map(ctx.meta)
-    closes = (
-        data["adj_close"].unstack("symbol")
-        if "adj_close" in data.columns
-        else data["close"].unstack("symbol")
-    )
+    closes = ctx.adjusted_closes()
     returns = closes.pct_change(fill_method=None)
     returns = returns.replace([np.inf, -np.inf], np.nan).dropna(how="all")
 
@@ -74,7 +85,8 @@ def compute_sleeve_weights(ctx: StrategyContext) -> Dict[str, pd.DataFrame]:
         corr_window=settings.regimes.corr_window_days,
         dispersion_window=settings.regimes.dispersion_window_days,
     )
-    regime_frame = detector.evaluate(data)
+    # Hand the detector the already-unstacked closes instead of the long frame.
+    regime_frame = detector.evaluate(pd.concat({"close": closes}, axis=1))
     if regime_frame.empty:
         momentum_scale_series = pd.Series(1.0, index=closes.index)
         mean_rev_scale_series = pd.Series(1.0, index=closes.index)
@@ -212,11 +224,7 @@ def compute_sleeve_weights(ctx: StrategyContext) -> Dict[str, pd.DataFrame]:
 def aggregate_target_weights(
     ctx: StrategyContext, sleeve_weights: Dict[str, pd.DataFrame]
 ) -> pd.DataFrame:
-    closes = (
-        ctx.daily["adj_close"].unstack("symbol")
-        if "adj_close" in ctx.daily.columns
-        else ctx.daily["close"].unstack("symbol")
-    )
+    closes = ctx.adjusted_closes()
     returns = closes.pct_change(fill_method=None)
     returns = returns.replace([np.inf, -np.inf], np.nan).dropna(how="all")
     aligned = []
@@ -228,7 +236,7 @@ def aggregate_target_weights(
     target = scale_to_target(target, returns, ctx.settings.portfolio.target_vol_ann)
     cost_model = TransactionCostModel(ctx.settings.costs)
     if "volume" in ctx.daily.columns:
-        volume = ctx.daily["volume"].unstack("symbol")
+        volume = ctx.wide("volume")
         dollar_volume = (
             closes.reindex(volume.index)
             .mul(volume, fill_value=0.0)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+
+from quantbobe.config.schema import Settings
+from quantbobe.data.alpaca import AlpacaProvider
+
+
+class _FakeBarsSession:
+    """Serves daily bars from ``/v2/stocks/bars`` in pages of ``page_size``."""
+
+    def __init__(self, page_size: int = 15) -> None:
+        self.page_size = page_size
+        self.requests: list[SimpleNamespace] = []
+        self.pages = 0
+
+    def get(self, url: str, params: dict, timeout: float) -> SimpleNamespace:
+        assert url.endswith("/v2/stocks/bars")
+        self.pages += 1
+        symbols = params["symbols"].split(",")
+        start = datetime.fromisoformat(params["start"])
+        end = datetime.fromisoformat(params["end"])
+        if "page_token" not in params:
+            self.requests.append(
+                SimpleNamespace(symbol_or_symbols=symbols, start=start, end=end)
+            )
+        dates = pd.date_range(start, end, freq="D").normalize().unique()
+        dates = dates[(dates >= start) & (dates <= end)]
+        rows = [
+            (
+                symbol,
+                {
+                    "t": date.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                    "o": 10.0 + i,
+                    "h": 11.0 + i,
+                    "l": 9.0 + i,
+                    "c": 10.0 + i,
+                    "v": 100,
+                    "n": 5,
+                    "vw": 10.0 + i,
+                },
+            )
+            for symbol in symbols
+            for i, date in enumerate(dates)
+        ]
+        offset = int(params.get("page_token", 0))
+        page = rows[offset : offset + self.page_size]
+        bars: dict[str, list[dict]] = {}
+        for symbol, bar in page:
+            bars.setdefault(symbol, []).append(bar)
+        token = offset + self.page_size
+        payload = {
+            "bars": bars,
+            "next_page_token": str(token) if token < len(rows) else None,
+        }
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: payload)
+
+
+def _provider(tmp_path, monkeypatch) -> tuple[AlpacaProvider, _FakeBarsSession]:
+    settings = Settings.model_validate(
+        {"data": {"provider": "alpaca", "path": str(tmp_path), "symbols": ["AAA"]}}
+    )
+    monkeypatch.setenv(settings.alpaca.key_env, "key")
+    monkeypatch.setenv(settings.alpaca.secret_env, "secret")
+    provider = AlpacaProvider(settings)
+    session = _FakeBarsSession()
+    provider._session = session  # type: ignore[assignment]
+    return provider, session
+
+
+def test_historical_bars_are_served_from_disk_cache(tmp_path, monkeypatch):
+    provider, client = _provider(tmp_path, monkeypatch)
+    start = datetime(2020, 1, 6, 15, 30, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 31, tzinfo=timezone.utc)
+
+    first = provider.get_daily_bars(["AAA"], start, end)
+    second = provider.get_daily_bars(["AAA"], start.replace(hour=0, minute=0), end)
+
+    assert len(client.requests) == 1
+    assert first.index.get_level_values("date").min() == pd.Timestamp("2020-01-07")
+    assert second.index.get_level_values("date").min() == pd.Timestamp("2020-01-06")
+    pd.testing.assert_frame_equal(first, second.iloc[1:])
+    cached = [path.name for path in (tmp_path / "cache" / "alpaca").rglob("*.parquet")]
+    assert cached == ["AAA.parquet"]
+
+
+def test_only_uncached_symbols_are_requested(tmp_path, monkeypatch):
+    provider, client = _provider(tmp_path, monkeypatch)
+    start = datetime(2020, 1, 6, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 31, tzinfo=timezone.utc)
+
+    provider.get_daily_bars(["AAA"], start, end)
+    bars = provider.get_daily_bars(["AAA", "BBB"], start, end)
+    provider.get_daily_bars(["AAA", "BBB"], start, end + timedelta(days=10))
+
+    assert [r.symbol_or_symbols for r in client.requests] == [
+        ["AAA"],
+        ["BBB"],
+        ["AAA", "BBB"],
+    ]
+    assert client.requests[2].start == end
+    assert set(bars.index.get_level_values("symbol")) == {"AAA", "BBB"}
+    extended = provider.get_daily_bars(["AAA", "BBB"], start, end + timedelta(days=10))
+    assert len(client.requests) == 3
+    assert len(extended.xs("AAA", level="symbol")) == 36
+
+
+def test_recent_tail_is_reused_until_ttl_expires(tmp_path, monkeypatch):
+    provider, client = _provider(tmp_path, monkeypatch)
+    end = datetime.now(timezone.utc)
+    start = end - timedelta(days=30)
+
+    bars = provider.get_daily_bars(["AAA"], start, end)
+    provider.get_daily_bars(["AAA"], start, end + timedelta(seconds=5))
+
+    assert len(client.requests) == 1
+    assert not bars.index.duplicated().any()
+
+    provider.data_config.bar_cache_recent_ttl_minutes = 0.0
+    refreshed = provider.get_daily_bars(["AAA"], start, end)
+    assert len(client.requests) == 2
+    assert client.requests[1].start < end - timedelta(days=6)
+    assert not refreshed.index.duplicated().any()
+    assert len(refreshed) == len(bars)
+
+
+def test_paginated_responses_are_stitched_per_symbol(tmp_path, monkeypatch):
+    provider, session = _provider(tmp_path, monkeypatch)
+    provider.data_config.bar_cache = False
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2020, 1, 20, tzinfo=timezone.utc)
+
+    bars = provider.get_daily_bars(["AAA", "BBB"], start, end)
+
+    assert session.pages == 3
+    assert len(bars) == 40
+    assert bars.index.is_monotonic_increasing
+    assert bars["volume"].dtype == float
+    aaa = bars.xs("AAA", level="symbol")
+    assert list(aaa["close"]) == [10.0 + i for i in range(20)]
+    pd.testing.assert_series_equal(aaa["adj_close"], aaa["close"], check_names=False)
+
+
+def test_disjoint_windows_are_both_kept_in_the_cache(tmp_path, monkeypatch):
+    provider, client = _provider(tmp_path, monkeypatch)
+    january = (
+        datetime(2020, 1, 6, tzinfo=timezone.utc),
+        datetime(2020, 1, 31, tzinfo=timezone.utc),
+    )
+    march = (
+        datetime(2020, 3, 2, tzinfo=timezone.utc),
+        datetime(2020, 3, 31, tzinfo=timezone.utc),
+    )
+
+    first_march = provider.get_daily_bars(["AAA"], *march)
+    first_january = provider.get_daily_bars(["AAA"], *january)
+    cached_march = provider.get_daily_bars(["AAA"], *march)
+    cached_january = provider.get_daily_bars(["AAA"], *january)
+
+    assert [r.start for r in client.requests] == [march[0], january[0]]
+    pd.testing.assert_frame_equal(first_march, cached_march)
+    pd.testing.assert_frame_equal(first_january, cached_january)
+
+    spanning = provider.get_daily_bars(["AAA"], january[0], march[1])
+    assert [r.start for r in client.requests[2:]] == [january[1]]
+    assert len(spanning) == (march[1] - january[0]).days + 1
+    provider.get_daily_bars(["AAA"], january[0], march[1])
+    assert len(client.requests) == 3
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import math
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+from alpaca.trading.enums import OrderSide, TimeInForce
+
+from quantbobe.execution.broker_alpaca import AlpacaBroker, OrderTicket, _round_cents
+
+
+def test_round_cents_matches_decimal_half_up():
+    rng = np.random.default_rng(0)
+    prices = [1.005, 2.675, 0.125, 10.0, 99.995, 1234.565, -1.005]
+    # Just below a half cent: must not be nudged up to the next cent.
+    prices += [1.00499999999999, 2.67499999999995, 100.004999999999]
+    prices += [math.nextafter(1.005, 0.0), math.nextafter(2.675, 0.0)]
+    prices += [math.nextafter(99.995, 1e9)]
+    prices += list(np.round(rng.uniform(0, 5_000, 2_000), 3))
+    prices += list(rng.uniform(0, 5_000, 2_000))
+
+    for price in prices:
+        expected = Decimal(str(price)).quantize(Decimal("0.01"), ROUND_HALF_UP)
+        assert _round_cents(float(price)) == float(expected), price
+
+
+class _RecordingClient:
+    def __init__(self) -> None:
+        self.requests: list = []
+
+    def submit_order(self, request) -> None:
+        self.requests.append(request)
+
+
+def test_submit_orders_builds_requests_per_ticket_type(monkeypatch):
+    monkeypatch.delenv("ALPACA_API_KEY_ID", raising=False)
+    monkeypatch.delenv("ALPACA_API_SECRET_KEY", raising=False)
+    broker = AlpacaBroker()
+    client = _RecordingClient()
+    broker._client = client
+
+    broker.submit_orders(
+        [
+            OrderTicket("AAA", 10, "BUY", "LIMIT", limit_price=1.005),
+            OrderTicket("BBB", 5, "sell", "market"),
+            OrderTicket("CCC", 0.0, "buy", "market"),
+        ]
+    )
+
+    limit, market = sorted(client.requests, key=lambda request: request.symbol)
+    assert (limit.symbol, limit.side, limit.limit_price) == ("AAA", OrderSide.BUY, 1.01)
+    assert (market.symbol, market.side, market.qty) == ("BBB", OrderSide.SELL, 5)
+    assert limit.time_in_force == market.time_in_force == TimeInForce.DAY
@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+import pandas as pd
+
+from quantbobe.data.calendars import trading_days
+
+
+def test_trading_days_match_nyse_session_counts():
+    assert len(trading_days(datetime(2022, 1, 1), datetime(2022, 12, 31))) == 251
+    assert len(trading_days(datetime(2023, 1, 1), datetime(2023, 12, 31))) == 250
+    assert len(trading_days(datetime(2024, 1, 1), datetime(2024, 12, 31))) == 252
+
+
+def test_trading_days_skip_holidays_and_are_cached():
+    days = trading_days(datetime(2024, 3, 25), datetime(2024, 7, 8))
+    local = days.tz_convert("America/New_York").normalize().tz_localize(None)
+    for holiday in ("2024-03-29", "2024-05-27", "2024-06-19", "2024-07-04"):
+        assert pd.Timestamp(holiday) not in local
+    assert pd.Timestamp("2024-07-05") in local
+    assert trading_days(datetime(2024, 3, 25), datetime(2024, 7, 8)) is days
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from quantbobe import cli
+
+
+class _InlineExecutor:
+    """Runs submitted work immediately in this process."""
+
+    def __init__(self, max_workers: int, mp_context: object) -> None:
+        self.max_workers = max_workers
+
+    def __enter__(self) -> _InlineExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def submit(self, fn, *args) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _fake_worker(config_path: str, label: str) -> tuple[Path, dict[str, float]]:
+    if config_path == "bad.yaml":
+        raise RuntimeError("boom")
+    return Path(label), {"Sharpe": float(label[:2])}
+
+
+@pytest.fixture
+def batch_logs(monkeypatch) -> list[str]:
+    monkeypatch.setattr(cli, "ProcessPoolExecutor", _InlineExecutor)
+    monkeypatch.setattr(cli, "_backtest_worker", _fake_worker)
+    for var in cli._WORKER_THREAD_VARS:
+        monkeypatch.setenv(var, "1")
+    messages: list[str] = []
+    sink = logger.add(messages.append, format="{message}", level="INFO")
+    yield messages
+    logger.remove(sink)
+
+
+def test_backtest_batch_rejects_empty_config_list(batch_logs):
+    with pytest.raises(ValueError):
+        cli.backtest_batch_command([])
+
+
+def test_backtest_batch_reports_every_run_in_config_order(batch_logs):
+    configs = ["b.yaml", "bad.yaml", "a.yaml", "b.yaml"]
+
+    with pytest.raises(RuntimeError, match="1 of 4 backtests failed"):
+        cli.backtest_batch_command(configs, workers=2)
+
+    summaries = [m.strip() for m in batch_logs if " | Sharpe" in m]
+    assert summaries == [
+        "b.yaml | Sharpe: 0.0000",
+        "a.yaml | Sharpe: 2.0000",
+        "b.yaml | Sharpe: 3.0000",
+    ]
+    assert any(m.startswith("Backtest failed for bad.yaml") for m in batch_logs)
+
+
+def test_backtest_batch_subcommand_parses_configs_and_workers(monkeypatch):
+    argv = ["quantbobe", "backtest-batch", "--configs", "a.yaml", "b.yaml"]
+    monkeypatch.setattr("sys.argv", [*argv, "--workers", "3"])
+
+    args = cli.parse_args()
+
+    assert (args.command, args.configs, args.workers) == (
+        "backtest-batch",
+        ["a.yaml", "b.yaml"],
+        3,
+    )
+
+
+def test_write_csv_matches_pandas_to_csv_bytes(tmp_path):
+    frame = pd.DataFrame(
+        {
+            "stamped": pd.to_datetime(["2024-01-02 05:00", None, "2024-01-04 05:00"]),
+            "midnight": pd.to_datetime(["2024-01-02", "2024-01-03", None]),
+            "utc": pd.to_datetime(["2024-01-02 05:00"] * 3).tz_localize("UTC"),
+            "filled": [True, False, True],
+            "equity": [100.0, 1e-05, np.nan],
+            "qty": [1, 2, 3],
+        },
+        index=pd.Index(
+            pd.to_datetime(
+                ["2024-01-02 05:00", "2024-01-03 00:00", "2024-01-04 00:00"]
+            ),
+            name="date",
+        ),
+    )
+
+    for index in (True, False):
+        cli._write_csv(frame, tmp_path / "arrow.csv", index=index)
+        frame.to_csv(tmp_path / "pandas.csv", index=index)
+        expected = (tmp_path / "pandas.csv").read_bytes()
+        assert (tmp_path / "arrow.csv").read_bytes() == expected
@@ -33,3 +33,20 @@ def test_transaction_cost_model_estimates_costs():
     estimates = model.estimate_costs(target, current, adv, portfolio_value=1_000_000.0)
     assert estimates["total_cost"] > 0
     assert 0 < estimates["total_bps"] < 100
+
+
+def test_rebalance_threshold_holds_trades_that_cost_more_than_they_earn():
+    model = TransactionCostModel(CostConfig(spread_bps=2.0, impact_k=150.0))
+    symbols = ["LIQ", "ILLIQ", "BIG", "NOADV"]
+    current = pd.Series(0.0, index=symbols)
+    target = pd.Series([0.002, 0.002, 0.01, 0.002], index=symbols)
+    adv = pd.Series([1e9, 2_000.0, 2_000.0, 0.0], index=symbols)
+
+    optimized = model.optimize_rebalance_threshold(target, current, adv)
+
+    assert optimized.to_dict() == {
+        "LIQ": 0.002,
+        "ILLIQ": 0.0,
+        "BIG": 0.01,
+        "NOADV": 0.002,
+    }
@@ -3,7 +3,12 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from quantbobe.features._kernels import rolling_mean_std, row_rank_pct, segment_std
+from quantbobe.features.intraday import vwap_zscores
+from quantbobe.features.mean_reversion import MeanReversionConfig, MeanReversionSignals
 from quantbobe.features.momentum import cross_sectional_momentum
+from quantbobe.features.momentum_multi import MultiTimeframeMomentum
+from quantbobe.features.quality_value import compute_quality_value
 
 
 def build_prices():
@@ -39,3 +44,139 @@ def test_cross_sectional_momentum_sector_neutral():
     grouped = latest.groupby("sector")
     for _, group in grouped:
         assert abs(group["signal"].sum()) < 1e-6
+
+
+def test_rolling_mean_std_kernel_matches_pandas():
+    rng = np.random.default_rng(0)
+    values = rng.normal(0.0, 0.02, (300, 6))
+    values[40:80, 1] = 0.013  # flat stretch must give exactly zero deviation
+    values[rng.random(values.shape) < 0.05] = np.nan
+
+    mean, std = rolling_mean_std(values, 20, 10)
+
+    rolling = pd.DataFrame(values).rolling(20, min_periods=10)
+    np.testing.assert_allclose(mean, rolling.mean().to_numpy(), atol=1e-12)
+    expected_std = rolling.std(ddof=0).to_numpy()
+    np.testing.assert_allclose(std, expected_std, atol=1e-12)
+    assert np.array_equal(std == 0, expected_std == 0)
+
+
+def test_row_rank_pct_kernel_matches_pandas():
+    rng = np.random.default_rng(1)
+    values = rng.integers(0, 5, size=(30, 12)).astype(float)
+    values[values == 4] = np.nan
+    values[5] = np.nan
+
+    expected = pd.DataFrame(values).rank(axis=1, pct=True, method="average")
+
+    np.testing.assert_array_equal(row_rank_pct(values), expected.to_numpy())
+
+
+def test_segment_std_skips_nans_and_empty_segments():
+    values = np.array([1.0, 2.0, np.nan, 4.0, 5.0, np.nan])
+
+    stds = segment_std(values, np.array([0, 3, 5]), np.array([3, 5, 6]))
+
+    np.testing.assert_allclose(stds[:2], [0.5, 0.5])
+    assert np.isnan(stds[2])
+
+
+def test_vwap_zscores_filters_and_scores_per_symbol():
+    timestamps = pd.date_range("2024-01-02 14:30", periods=3, freq="min", tz="UTC")
+    index = pd.MultiIndex.from_product([timestamps, ["AAA", "BBB", "CCC"]])
+    intraday = pd.DataFrame(
+        {"close": [10.0, 20.0, 30.0] * 3, "volume": [100.0, 0.0, 100.0] * 3},
+        index=index,
+    )
+    daily = pd.DataFrame(
+        {"close": [11.0, 19.0, 30.0], "volume": [1e6, 1e6, 1e6]},
+        index=pd.MultiIndex.from_product(
+            [[pd.Timestamp("2024-01-01")], ["AAA", "BBB", "CCC"]],
+            names=["date", "symbol"],
+        ),
+    )
+
+    signals = vwap_zscores(
+        intraday, daily, {"AAA": "Tech"}, earnings_blackout=["CCC"], min_dollar_vol=0
+    )
+
+    assert list(signals.index) == ["AAA", "BBB"]
+    assert list(signals["sector"]) == ["Tech", "Unknown"]
+    # Flat closes hit the 1e-3 deviation floor; BBB's zero volume falls back
+    # to its last close as VWAP.
+    np.testing.assert_allclose(signals["zscore"], [1_000.0, -1_000.0])
+    np.testing.assert_allclose(signals["signal"], [-1.5, 1.5])
+
+
+def test_sector_neutral_long_short_breaks_ties_by_position():
+    dates = pd.date_range("2020-01-31", periods=1, freq="B")
+    symbols = ["T1", "T2", "T3", "T4", "H1", "H2", "H3"]
+    scores = pd.DataFrame(
+        [[0.5, 0.5, 0.5, 0.1, 0.9, np.nan, 0.2]], index=dates, columns=symbols
+    )
+    sectors = {s: "Tech" if s.startswith("T") else "Health" for s in symbols}
+    sectors["XX"] = "Empty"
+    prices = pd.DataFrame(100.0, index=dates, columns=symbols)
+
+    weights = MultiTimeframeMomentum().generate_long_short_portfolio(
+        prices, sectors, top_quantile=0.5, bottom_quantile=0.25, scores=scores
+    )
+
+    row = weights.iloc[0]
+    assert list(row) == [1 / 6, 1 / 6, 0.0, -1 / 3, 1 / 3, 0.0, -1 / 3]
+
+
+def test_quality_value_scores_each_symbol_over_time():
+    dates = pd.date_range("2020-03-31", periods=4, freq="QE")
+    index = pd.MultiIndex.from_product(
+        [dates, ["AAA", "BBB"]], names=["date", "symbol"]
+    )
+    fundamentals = pd.DataFrame(
+        {
+            "NetIncome": [1.0, 5.0, 2.0, 5.0, 3.0, 5.0, 4.0, 5.0],
+            "TotalAssets": 10.0,
+        },
+        index=index,
+    )
+
+    qv = compute_quality_value(fundamentals, lookahead_guard_days=0, fields=["ROA"])
+
+    aaa = qv["qv_score"].xs("AAA", level="symbol")
+    expected = (aaa.index.month / 3 - 2.5) / np.sqrt(1.25)
+    np.testing.assert_allclose(aaa.to_numpy(), expected.to_numpy())
+    assert (qv["qv_score"].xs("BBB", level="symbol") == 0.0).all()
+    assert str(qv.index.get_level_values("date").tz) == "UTC"
+
+
+def test_overnight_gaps_zero_out_missing_or_zero_prior_closes():
+    dates = pd.date_range("2021-01-04", periods=4, freq="B")
+    index = pd.MultiIndex.from_product([dates, ["AAA"]], names=["date", "symbol"])
+    data = pd.DataFrame(
+        {"open": [10.0, 11.0, 5.0, 6.0], "close": [10.0, 0.0, np.nan, 5.0]},
+        index=index,
+    )
+
+    gaps = MeanReversionSignals().compute_overnight_gaps(data)
+
+    assert list(gaps["AAA"]) == [0.0, 0.1, 0.0, 0.0]
+
+
+def test_mean_reversion_float32_inputs_track_float64():
+    rng = np.random.default_rng(4)
+    dates = pd.date_range("2021-01-01", periods=120, freq="B")
+    closes = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.005, (120, 3)), axis=0)),
+        index=dates,
+        columns=["AAA", "BBB", "CCC"],
+    )
+    data = closes.stack().rename_axis(["date", "symbol"]).to_frame("close")
+
+    signals = {
+        dtype: MeanReversionSignals(
+            MeanReversionConfig(z_score_threshold=1.0, gap_weight=0.0, dtype=dtype)
+        ).generate_signals(data)
+        for dtype in (np.float64, np.float32)
+    }
+
+    assert (signals[np.float64] != 0).any().any()
+    np.testing.assert_allclose(signals[np.float32], signals[np.float64], atol=1e-6)
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import os
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from quantbobe.data.local_csv import LocalCSVProvider
+
+
+def _bars(dates: pd.DatetimeIndex) -> pd.DataFrame:
+    n = len(dates)
+    close = pd.Series(range(n), dtype=float) + 100.0
+    return pd.DataFrame(
+        {
+            "date": dates,
+            "open": close - 0.5,
+            "high": close + 1.0,
+            "low": close - 1.0,
+            "close": close,
+            "adj_close": close,
+            "volume": 1_000,
+        }
+    )
+
+
+def test_local_csv_provider_windows_and_stacks_symbols(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=10, freq="B")
+    _bars(dates).to_csv(tmp_path / "AAA.csv", index=False)
+    tz_bars = _bars(dates)
+    tz_bars["date"] = tz_bars["date"].dt.tz_localize("UTC")
+    tz_bars.to_parquet(tmp_path / "BBB.parquet")
+    pd.DataFrame({"symbol": ["AAA", "BBB"]}).to_csv(
+        tmp_path / "universe.csv", index=False
+    )
+
+    provider = LocalCSVProvider(tmp_path, tmp_path / "universe.csv")
+    bars = provider.get_daily_bars(
+        ["AAA", "BBB"],
+        datetime(2024, 1, 3, tzinfo=timezone.utc),
+        datetime(2024, 1, 9),
+    )
+
+    assert list(bars.index.names) == ["date", "symbol"]
+    assert bars.index.get_level_values("date").tz is None
+    expected_dates = dates[(dates >= "2024-01-03") & (dates <= "2024-01-09")]
+    for symbol in ("AAA", "BBB"):
+        frame = bars.xs(symbol, level="symbol")
+        assert list(frame.index) == list(expected_dates)
+        assert frame["close"].dtype == float
+    assert bars.index.is_monotonic_increasing
+
+
+def test_local_csv_provider_keeps_wall_clock_of_offset_dates(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=5, freq="B", tz="America/New_York")
+    bars = _bars(dates)
+    bars["date"] = bars["date"].map(lambda ts: ts.isoformat())
+    bars.to_csv(tmp_path / "AAA.csv", index=False)
+    _bars(dates.tz_localize(None)).to_csv(tmp_path / "BBB.csv", index=False)
+    pd.DataFrame({"symbol": ["AAA", "BBB"]}).to_csv(
+        tmp_path / "universe.csv", index=False
+    )
+
+    provider = LocalCSVProvider(tmp_path, tmp_path / "universe.csv")
+    loaded = provider.get_daily_bars(
+        ["AAA", "BBB"], datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+    assert "2024-01-01T00:00:00-05:00" in (tmp_path / "AAA.csv").read_text()
+    expected = list(dates.tz_localize(None))
+    assert list(loaded.xs("AAA", level="symbol").index) == expected
+    assert list(loaded.xs("BBB", level="symbol").index) == expected
+
+
+def test_local_csv_provider_returns_empty_frame_outside_window(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    _bars(dates).to_csv(tmp_path / "AAA.csv", index=False)
+    pd.DataFrame({"symbol": ["AAA"]}).to_csv(tmp_path / "universe.csv", index=False)
+
+    provider = LocalCSVProvider(tmp_path, tmp_path / "universe.csv")
+    bars = provider.get_daily_bars(["AAA"], datetime(2030, 1, 1), datetime(2030, 2, 1))
+
+    assert bars.empty
+
+
+def test_local_csv_provider_reads_repeated_symbols_once(tmp_path):
+    dates = pd.date_range("2024-01-01", periods=5, freq="B")
+    _bars(dates).to_csv(tmp_path / "AAA.csv", index=False)
+    _bars(dates).to_csv(tmp_path / "BBB.csv", index=False)
+    pd.DataFrame({"symbol": ["AAA", "BBB"]}).to_csv(
+        tmp_path / "universe.csv", index=False
+    )
+
+    provider = LocalCSVProvider(tmp_path, tmp_path / "universe.csv")
+    bars = provider.get_daily_bars(
+        ["BBB", "AAA", "BBB"], datetime(2024, 1, 1), datetime(2024, 1, 31)
+    )
+
+    assert len(bars) == 10
+    assert bars.index.is_unique
+    assert set(bars.index.get_level_values("symbol")) == {"AAA", "BBB"}
+
+
+def test_symbol_meta_is_reread_after_universe_changes(tmp_path):
+    universe = tmp_path / "universe.csv"
+    pd.DataFrame({"symbol": ["AAA", "BBB"], "sector": ["Tech", "Energy"]}).to_csv(
+        universe, index=False
+    )
+    provider = LocalCSVProvider(tmp_path, universe)
+    meta = provider.get_symbol_meta()
+    assert [(m.symbol, m.sector) for m in meta] == [("AAA", "Tech"), ("BBB", "Energy")]
+    assert LocalCSVProvider(tmp_path, universe).get_symbol_meta() == meta
+
+    pd.DataFrame({"symbol": ["CCC"]}).to_csv(universe, index=False)
+    os.utime(universe, ns=(0, universe.stat().st_mtime_ns + 1_000_000))
+    meta = provider.get_symbol_meta()
+    assert [(m.symbol, m.sector) for m in meta] == [("CCC", None)]
+
+
+def test_symbol_meta_maps_blank_sectors_to_none(tmp_path):
+    universe = tmp_path / "universe.csv"
+    universe.write_text("symbol,sector\nAAA,Tech\nBBB,\n")
+
+    meta = LocalCSVProvider(tmp_path, universe).get_symbol_meta()
+
+    assert [(m.symbol, m.sector) for m in meta] == [("AAA", "Tech"), ("BBB", None)]
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from quantbobe.backtest.metrics import (
+    max_drawdown,
+    sharpe_ratio,
+    sortino_ratio,
+    value_at_risk,
+)
+
+
+def test_ratios_match_pandas_reference():
+    rng = np.random.default_rng(7)
+    returns = pd.Series(rng.normal(0.0005, 0.01, 500))
+    returns.iloc[[3, 40]] = np.nan
+
+    excess = returns - 0.02 / 252
+    expected_sharpe = np.sqrt(252) * excess.mean() / excess.std(ddof=0)
+    downside = returns[returns < 0]
+    expected_sortino = np.sqrt(252) * returns.mean() / downside.std(ddof=0)
+
+    assert sharpe_ratio(returns, risk_free=0.02) == pytest.approx(expected_sharpe)
+    assert sortino_ratio(returns) == pytest.approx(expected_sortino)
+    assert sharpe_ratio(pd.Series([0.01, 0.01])) == 0.0
+
+
+def test_max_drawdown_skips_missing_values():
+    equity = pd.Series([np.nan, 100.0, 120.0, np.nan, 90.0, 130.0])
+    assert max_drawdown(equity) == pytest.approx(90.0 / 120.0 - 1.0)
+    assert np.isnan(max_drawdown(pd.Series(dtype=float)))
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, 501])
+@pytest.mark.parametrize("alpha", [0.95, 0.99])
+def test_value_at_risk_matches_series_quantile(size, alpha):
+    returns = pd.Series(np.random.default_rng(size).normal(0.0, 0.02, size))
+    expected = returns.quantile(1 - alpha)
+    assert value_at_risk(returns, alpha) == pytest.approx(expected)
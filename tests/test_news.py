@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from loguru import logger
+
+from quantbobe.data.news import NewsFetcher
+
+
+class _FakeFinnhubSession:
+    """Serves one article per symbol from ``/api/v1/company-news``."""
+
+    def __init__(self) -> None:
+        self.symbols: list[str] = []
+        self._lock = threading.Lock()
+
+    def get(self, url: str, params: dict, timeout: float) -> SimpleNamespace:
+        assert url.endswith("/api/v1/company-news")
+        symbol = params["symbol"]
+        with self._lock:
+            self.symbols.append(symbol)
+        payload = [
+            {"datetime": 1_700_000_000, "headline": f"{symbol} news", "url": "u"}
+        ]
+        return SimpleNamespace(
+            raise_for_status=lambda: None, content=json.dumps(payload).encode()
+        )
+
+
+def _fetcher(monkeypatch) -> tuple[NewsFetcher, _FakeFinnhubSession]:
+    monkeypatch.setenv("FINNHUB_API_KEY", "key")
+    fetcher = NewsFetcher()
+    session = _FakeFinnhubSession()
+    fetcher._session = session  # type: ignore[assignment]
+    return fetcher, session
+
+
+def test_company_headlines_fetch_only_stale_symbols_in_order(monkeypatch):
+    fetcher, session = _fetcher(monkeypatch)
+
+    first = fetcher.get_company_headlines(["BBB", "AAA"])
+    second = fetcher.get_company_headlines(["CCC", "AAA", "BBB", "DDD"])
+
+    assert list(first) == ["BBB", "AAA"]
+    assert list(second) == ["CCC", "AAA", "BBB", "DDD"]
+    assert sorted(session.symbols) == ["AAA", "BBB", "CCC", "DDD"]
+    assert [a.headline for a in second["DDD"]] == ["DDD news"]
+
+
+def test_market_headlines_parse_iso_timestamps(monkeypatch):
+    monkeypatch.setenv("NEWSAPI_KEY", "key")
+    payload = {
+        "articles": [
+            {"title": "old", "publishedAt": "2024-01-02T03:04:05Z"},
+            {"title": "new", "publishedAt": "2024-01-03T00:00:00.5Z"},
+            {"title": "bad", "publishedAt": "yesterday"},
+        ]
+    }
+    response = SimpleNamespace(
+        raise_for_status=lambda: None, content=json.dumps(payload).encode()
+    )
+    fetcher = NewsFetcher(general_headlines=3)
+    fetcher._session = SimpleNamespace(  # type: ignore[assignment]
+        get=lambda url, params, headers, timeout: response
+    )
+
+    headlines = fetcher.get_market_headlines()
+
+    assert [a.headline for a in headlines] == ["bad", "new", "old"]
+    assert headlines[1].published_at == datetime(
+        2024, 1, 3, 0, 0, 0, 500_000, tzinfo=timezone.utc
+    )
+    assert headlines[2].published_at.tzinfo == timezone.utc
+
+
+def test_company_headlines_survive_restart_via_disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("FINNHUB_API_KEY", "key")
+    session = _FakeFinnhubSession()
+    for _ in range(2):
+        fetcher = NewsFetcher(cache_dir=tmp_path)
+        fetcher._session = session  # type: ignore[assignment]
+        headlines = fetcher.get_company_headlines(["AAA"])
+        assert [a.headline for a in headlines["AAA"]] == ["AAA news"]
+
+    assert session.symbols == ["AAA"]
+    assert [p.name for p in tmp_path.iterdir()] == ["company-AAA.pkl"]
+
+
+def test_incompatible_or_unpicklable_cache_entries_are_skipped(tmp_path):
+    messages: list[str] = []
+    sink = logger.add(messages.append, format="{message}", level="WARNING")
+    fetcher = NewsFetcher(cache_dir=tmp_path)
+    # An entry pickled against a class this version no longer defines.
+    (tmp_path / "general.pkl").write_bytes(b"cquantbobe.data.news\nRemovedArticle\n.")
+    try:
+        assert fetcher._read_cached("general") is None
+        fetcher._write_cached("company-AAA", (datetime.now(timezone.utc), [lambda: 0]))
+    finally:
+        logger.remove(sink)
+
+    assert messages[0].startswith("Ignoring unreadable news cache entry general: ")
+    assert messages[1].startswith("Failed to persist news cache entry company-AAA: ")
+    assert [p.name for p in tmp_path.iterdir()] == ["general.pkl"]
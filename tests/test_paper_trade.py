@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -39,3 +40,30 @@ def test_dummy_broker_paper_trade_generates_expected_return():
     paper_return = (ending_equity - starting_equity) / starting_equity
 
     assert paper_return == pytest.approx(0.05, rel=1e-6)
+
+
+def test_router_floors_short_remainder_and_skips_unpriced_symbols():
+    router = ExecutionRouter(SlippageModel(spread_bps=0.0, impact_k=0.0))
+    target = pd.Series({"AAA": -0.105, "BBB": 0.2, "CCC": 0.1, "DDD": 0.0})
+    current = pd.Series({"AAA": 0.1, "DDD": 0.0})
+    prices = pd.Series({"AAA": 100.0, "BBB": 50.0, "DDD": 10.0})
+
+    slices = router.reconcile_positions(target, current, prices, 10_000.0)
+    orders = router.build_orders(slices, 10_000.0)
+
+    assert list(slices.symbol) == ["AAA", "BBB", "DDD"]
+    assert [(o.symbol, o.side, o.qty) for o in orders] == [
+        ("AAA", "sell", 20.0),
+        ("BBB", "buy", 40.0),
+    ]
+
+
+def test_slippage_cost_accepts_scalars_and_arrays():
+    slippage = SlippageModel(spread_bps=2.0, impact_k=0.9)
+    participation = np.array([0.0, 0.01, 0.25, 1.0])
+
+    costs = slippage.estimate_cost(participation)
+
+    expected = 1e-4 + 0.9 * np.maximum(participation, 1e-6) ** 1.5
+    np.testing.assert_allclose(costs, expected, rtol=1e-12)
+    assert slippage.estimate_cost(0.25) == pytest.approx(costs[2])
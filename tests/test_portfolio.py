@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from quantbobe.portfolio.constraints import clamp_beta
+from quantbobe.portfolio.constraints import clamp_beta, enforce_sector_neutrality
 
 
 def test_beta_clamp_limits_portfolio_beta():
@@ -12,3 +13,13 @@ def test_beta_clamp_limits_portfolio_beta():
     beta_series = pd.Series(betas).reindex(adjusted.index).fillna(1.0)
     portfolio_beta = float((adjusted * beta_series).sum())
     assert abs(portfolio_beta) <= 0.051
+
+
+def test_sector_neutrality_demeans_within_each_sector():
+    weights = pd.Series({"A": 0.5, "B": 0.25, "C": -0.2, "D": 0.05})
+    sectors = {"A": "Tech", "B": "Tech", "C": "Energy"}
+
+    adjusted = enforce_sector_neutrality(weights, sectors)
+
+    assert adjusted[["A", "B", "C"]].tolist() == [0.125, -0.125, 0.0]
+    assert np.isnan(adjusted["D"])
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from quantbobe.features.regimes import regime_weights
+from quantbobe.features.regimes import RegimeDetector, regime_weights
 
 
 def test_regime_weights_interpolates_between_states():
@@ -22,3 +23,71 @@ def test_regime_weights_interpolates_between_states():
     mid = weights[breadth.index[1]]
     assert abs(mid["C"] - 0.7) < 1e-6
     assert abs(mid["D"] - 0.3) < 1e-6
+
+
+def test_corr_score_matches_pandas_rolling_corr():
+    rng = np.random.default_rng(0)
+    market = rng.normal(0, 0.01, (120, 1))
+    returns = pd.DataFrame(
+        market + rng.normal(0, 0.01, (120, 4)),
+        index=pd.date_range("2020-01-01", periods=120, freq="B"),
+    )
+    detector = RegimeDetector(corr_window=30)
+
+    upper = np.triu(np.ones((4, 4), dtype=bool), k=1)
+    pairwise = returns.rolling(30, min_periods=15).corr()
+    expected = pairwise.groupby(level=0).apply(lambda mat: mat.to_numpy()[upper].mean())
+
+    score = detector._corr_score(returns)
+
+    np.testing.assert_allclose(score[14:], expected[14:], rtol=1e-10)
+    assert (score[:14] == 0.0).all()
+
+
+def test_evaluate_reuses_results_until_prices_change(monkeypatch):
+    rng = np.random.default_rng(1)
+    closes = pd.DataFrame(
+        100 * np.exp(np.cumsum(rng.normal(0, 0.01, (80, 3)), axis=0)),
+        index=pd.date_range("2021-01-01", periods=80, freq="B"),
+        columns=["AAA", "BBB", "CCC"],
+    )
+    calls: list[int] = []
+    original = RegimeDetector._corr_score
+
+    def counting_corr_score(self, returns):
+        calls.append(len(returns))
+        return original(self, returns)
+
+    monkeypatch.setattr(RegimeDetector, "_corr_score", counting_corr_score)
+    detector = RegimeDetector(breadth_window=20, corr_window=10)
+
+    first = detector.evaluate(pd.concat({"close": closes}, axis=1))
+    again = RegimeDetector(breadth_window=20, corr_window=10).evaluate(
+        pd.concat({"close": closes.copy()}, axis=1)
+    )
+    closes.iloc[-1, 0] *= 1.05
+    detector.evaluate(pd.concat({"close": closes}, axis=1))
+
+    assert len(calls) == 2
+    pd.testing.assert_frame_equal(first, again)
+
+
+def test_vol_and_dispersion_match_pandas_rolling_std():
+    rng = np.random.default_rng(2)
+    returns = pd.DataFrame(
+        rng.normal(0, 0.01, (60, 4)),
+        index=pd.date_range("2020-01-01", periods=60, freq="B"),
+    )
+    returns.iloc[:25, 0] = np.nan
+    returns.iloc[10:30, 1] = 0.0
+    detector = RegimeDetector(vol_window=12, dispersion_window=8)
+
+    rolling_vol = returns.rolling(12, min_periods=6).std(ddof=0)
+    rolling_disp = returns.rolling(8, min_periods=5).std(ddof=0)
+
+    pd.testing.assert_series_equal(
+        detector._realized_vol(returns), rolling_vol.mean(axis=1).ffill()
+    )
+    pd.testing.assert_series_equal(
+        detector._dispersion(returns), rolling_disp.mean(axis=1).ffill().fillna(0.0)
+    )
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pandas as pd
+
+from quantbobe.data import yahoo
+from quantbobe.data.yahoo import YahooProvider
+
+
+def _fake_download(calls: list[list[str]]):
+    def download(tickers, start, end, group_by, **kwargs) -> pd.DataFrame:
+        assert group_by == "ticker"
+        calls.append(list(tickers))
+        frames = {}
+        for offset, ticker in enumerate(sorted(tickers)):
+            dates = pd.date_range(start, end, freq="B", inclusive="left", name="Date")
+            close = pd.Series(range(len(dates)), index=dates, dtype=float)
+            close += 100.0 * len(calls)
+            close.iloc[:offset] = float("nan")
+            frames[ticker] = pd.DataFrame(
+                {"Open": close, "Close": close, "Adj Close": close, "Volume": close}
+            )
+        return pd.concat(frames, axis=1, names=["Ticker", "Price"])
+
+    return download
+
+
+def test_daily_downloads_batch_misses_and_reuse_disk_cache(tmp_path, monkeypatch):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(yahoo.yf, "download", _fake_download(calls))
+    universe = tmp_path / "universe.csv"
+    universe.write_text("symbol\nAAA\nBBB\n")
+    start, end = datetime(2020, 1, 1), datetime(2020, 2, 1)
+
+    first = YahooProvider(str(universe), cache_dir=tmp_path / "cache")
+    cold = first.get_daily_bars(["AAA"], start, end)
+    restarted = YahooProvider(str(universe), cache_dir=tmp_path / "cache")
+    warm = restarted.get_daily_bars(["AAA", "BBB"], start, end)
+
+    assert calls == [["AAA"], ["BBB"]]
+    pd.testing.assert_frame_equal(
+        cold, warm.xs("AAA", level="symbol", drop_level=False)
+    )
+    assert list(warm.index.names) == ["date", "symbol"]
+    assert warm.index.is_monotonic_increasing
+    assert {"close", "adj_close", "volume"} <= set(warm.columns)
+
+
+def test_expired_recent_window_is_downloaded_again(tmp_path, monkeypatch):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(yahoo.yf, "download", _fake_download(calls))
+    universe = tmp_path / "universe.csv"
+    universe.write_text("symbol\nAAA\n")
+    end = datetime.now()
+    start = end - timedelta(days=30)
+
+    provider = YahooProvider(
+        str(universe), cache_dir=tmp_path / "cache", recent_ttl_minutes=0
+    )
+    first = provider.get_daily_bars(["AAA"], start, end)
+    second = provider.get_daily_bars(["AAA"], start, end)
+
+    assert calls == [["AAA"], ["AAA"]]
+    assert (second["close"] - first["close"] == 100.0).all()
+
+
+def test_batched_download_drops_alignment_padding(monkeypatch):
+    calls: list[list[str]] = []
+    monkeypatch.setattr(yahoo.yf, "download", _fake_download(calls))
+    data = yahoo.yf.download(["AAA", "BBB"], "2020-01-01", "2020-01-10", "ticker")
+
+    assert len(yahoo._ticker_frame(data, "BBB")) == len(data) - 1
+    assert yahoo._ticker_frame(data, "ZZZ").empty
+
+
+def test_fundamentals_are_stacked_and_lagged(tmp_path, monkeypatch):
+    statement_dates = pd.to_datetime(["2023-09-30", "2022-09-30"])
+    financials = {
+        "AAA": pd.DataFrame([[1.0, 2.0]], index=["Revenue"], columns=statement_dates),
+        "BBB": pd.DataFrame(),
+    }
+    tickers = {s: SimpleNamespace(financials=f) for s, f in financials.items()}
+    monkeypatch.setattr(
+        yahoo.yf, "Tickers", lambda symbols: SimpleNamespace(tickers=tickers)
+    )
+    universe = tmp_path / "universe.csv"
+    universe.write_text("symbol\nAAA\n")
+
+    df = YahooProvider(str(universe)).get_fundamentals(["AAA", "BBB"])
+
+    assert list(df.index) == [
+        (pd.Timestamp("2022-10-05"), "AAA"),
+        (pd.Timestamp("2023-10-05"), "AAA"),
+    ]
+    assert list(df["Revenue"]) == [2.0, 1.0]